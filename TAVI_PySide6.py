@@ -1233,10 +1233,13 @@ class TAVIController(QObject):
         # Sample orientation controls - connected later in signal setup
         # (omega/chi are actual angles, psi/kappa are alignment offsets)
         
-        # Misalignment training dock
-        self.window.misalignment_dock.check_alignment_button.clicked.connect(self.on_check_alignment)
-        self.window.misalignment_dock.load_hash_button.clicked.connect(self.on_load_misalignment_hash)
-        self.window.misalignment_dock.clear_misalignment_button.clicked.connect(self.on_clear_misalignment)
+        # Misalignment training and reciprocal-space docks are built lazily by
+        # the window; wire whichever already exist now and the rest on creation.
+        if self.window.misalignment_dock is not None:
+            self._connect_misalignment_dock(self.window.misalignment_dock)
+        if self.window.reciprocal_space_dock is not None:
+            self._connect_reciprocal_dock(self.window.reciprocal_space_dock)
+        self.window.dock_created.connect(self._on_dock_created)
         
         # UB Matrix dock
         self.window.ub_matrix_dock.calculate_ub_button.clicked.connect(self.on_calculate_ub)
@@ -1297,15 +1300,6 @@ class TAVIController(QObject):
         if getattr(self.window.instrument_dock, "nmo_combo", None) is not None:
             self.window.instrument_dock.nmo_combo.currentTextChanged.connect(self.update_ideal_bending_buttons)
 
-        reciprocal_dock = getattr(self.window, "reciprocal_space_dock", None)
-        if reciprocal_dock is not None:
-            reciprocal_dock.move_requested.connect(self.apply_reciprocal_move)
-            reciprocal_dock.live_move_requested.connect(self.apply_reciprocal_live_move)
-            reciprocal_dock.values_requested.connect(self.apply_reciprocal_values)
-            reciprocal_dock.plane_requested.connect(self.set_reciprocal_plane)
-            self.reciprocal_state_changed.connect(reciprocal_dock.set_snapshot)
-            self.reciprocal_live_result.connect(reciprocal_dock.set_live_result)
-
         # Ideal focusing buttons
         self.window.instrument_dock.rhm_ideal_button.clicked.connect(
             lambda: self.apply_ideal_bending_value("rhm")
@@ -1557,6 +1551,8 @@ class TAVIController(QObject):
         try:
             if advisory_result is None:
                 self._set_reciprocal_advisory_style(True)
+            if getattr(self.window, "reciprocal_space_dock", None) is None:
+                return  # nothing consumes the snapshot until the dock is opened
             vals = self.get_gui_values()
             if not vals:
                 return
@@ -2129,7 +2125,7 @@ class TAVIController(QObject):
 
         # (H,K,L) -> q0 via the same sample-mount/UB solve the scan generator uses.
         qx, qy, qz = self._hkl_to_sample_q(H, K, L, vals)
-        q0 = math.sqrt(qx ** 2 + qy ** 2 + qz ** 2)
+        q0 = math.hypot(qx, qy, qz)
 
         # Feasibility gate: the same per-point angle solve run_simulation applies
         # (throwaway check_state, calculate_angles error flags). Infeasible ->
@@ -3606,6 +3602,17 @@ class TAVIController(QObject):
         else:
             self.window.simulation_dock.update_total_time_estimate("")
     
+    # Lower-cased scan variable -> index into _count_valid_scan_points' 14-element
+    # point (Q/angles, bending, chi/kappa/psi, then H/K/L).
+    _COUNT_VARIABLE_TO_INDEX = {
+        'qx': 0, 'qy': 1, 'qz': 2, 'deltae': 3,
+        'rhm': 4, 'rvm': 5, 'rha': 6, 'rva': 7,
+        'chi': 8, 'kappa': 9, 'psi': 10, 'omega': 10,
+        'h': 11, 'k': 12, 'l': 13,
+        'a1': 0, 'a2': 1, 'a3': 2, 'a4': 3,  # Angle mode
+        '2theta': 1,
+    }
+
     def _count_valid_scan_points(self, cmd1: str, cmd2: str) -> tuple:
         """Count valid and invalid scan points for given scan commands.
         
@@ -3629,14 +3636,7 @@ class TAVIController(QObject):
             vals.get('H', 0), vals.get('K', 0), vals.get('L', 0)
         ]
         
-        variable_to_index = {
-            'qx': 0, 'qy': 1, 'qz': 2, 'deltae': 3,
-            'rhm': 4, 'rvm': 5, 'rha': 6, 'rva': 7,
-            'chi': 8, 'kappa': 9, 'psi': 10, 'omega': 10,
-            'h': 11, 'k': 12, 'l': 13,
-            'a1': 0, 'a2': 1, 'a3': 2, 'a4': 3,  # Angle mode
-            '2theta': 1,
-        }
+        variable_to_index = self._COUNT_VARIABLE_TO_INDEX
         
         # Determine scan mode
         scan_mode = self._determine_scan_mode(cmd1, cmd2)
@@ -3662,18 +3662,14 @@ class TAVIController(QObject):
             if variable_name2:
                 variable_name2 = self.normalize_scan_variable(variable_name2).lower()
             
+            scan_points = []
             # 1D scan
             if cmd1 and not cmd2:
                 for value1 in array_values1:
                     scan_point = scan_point_template[:]
                     if variable_name1 in variable_to_index:
                         scan_point[variable_to_index[variable_name1]] = value1
-                    
-                    valid = self._validate_scan_point(scan_point, scan_mode, vals, check_state)
-                    if valid:
-                        valid_count += 1
-                    else:
-                        invalid_count += 1
+                    scan_points.append(scan_point)
             
             # 2D scan
             elif cmd1 and cmd2:
@@ -3684,55 +3680,88 @@ class TAVIController(QObject):
                             scan_point[variable_to_index[variable_name1]] = value1
                         if variable_name2 in variable_to_index:
                             scan_point[variable_to_index[variable_name2]] = value2
-                        
-                        valid = self._validate_scan_point(scan_point, scan_mode, vals, check_state)
-                        if valid:
-                            valid_count += 1
-                        else:
-                            invalid_count += 1
+                        scan_points.append(scan_point)
+            
+            if scan_mode in ("momentum", "rlu"):
+                q_points = [
+                    self._scan_point_q(scan_point, scan_mode, check_state.sample_mount,
+                                       hkl_index=variable_to_index['h'])
+                    for scan_point in scan_points
+                ]
+                valid = self._scan_valid_mask(check_state, scan_mode, q_points)
+            else:
+                # Angle and orientation modes are always counted as valid
+                valid = [True] * len(scan_points)
+            valid_count = sum(valid)
+            invalid_count = len(valid) - valid_count
         except Exception as e:
             # If parsing fails, return 0 valid points
             return (0, 0)
         
         return (valid_count, invalid_count)
     
-    def _validate_scan_point(self, scan_point: list, scan_mode: str, vals: dict, check_state) -> bool:
-        """Validate a single scan point.
-        
-        Args:
-            scan_point: List of scan parameters
-            scan_mode: One of 'momentum', 'rlu', 'angle', 'orientation'
-            vals: GUI values dictionary
-            check_state: throwaway instrument state (configured with GUI values)
-            
-        Returns:
-            True if point is valid, False otherwise
+    @staticmethod
+    def _scan_point_q(scan_point, scan_mode, sample_mount, hkl_index=0):
+        """``(qx, qy, qz, deltaE)`` of a scan point, or None when it has no Q.
+
+        ``hkl_index`` is where H, K, L sit in the point: 0 for run-scan points
+        (rlu mode carries HKL in the Q slots), ``_COUNT_VARIABLE_TO_INDEX['h']``
+        for the point-count template. None is returned in angle mode and when
+        HKL cannot be converted to Q; :meth:`_scan_valid_mask` counts such
+        points as invalid.
         """
+        if scan_mode in ("momentum", "orientation"):
+            return tuple(scan_point[:4])
+        if scan_mode != "rlu":
+            return None
+        H, K, L = scan_point[hkl_index:hkl_index + 3]
         try:
-            if scan_mode == "momentum":
-                qx, qy, qz, deltaE = scan_point[:4]
-                _, error_flags = check_state.calculate_angles(
-                    qx, qy, qz, deltaE, check_state.fixed_E, check_state.K_fixed,
-                    check_state.monocris, check_state.anacris
-                )
-                return not error_flags
-            elif scan_mode == "rlu":
-                H, K, L = scan_point[11], scan_point[12], scan_point[13]
-                deltaE = scan_point[3]
-                qx, qy, qz = component_q_to_instrument_q(
-                    check_state.sample_mount.hkl_to_q(H, K, L)
-                )
-                _, error_flags = check_state.calculate_angles(
-                    qx, qy, qz, deltaE, check_state.fixed_E, check_state.K_fixed,
-                    check_state.monocris, check_state.anacris
-                )
-                return not error_flags
-            else:
-                # Angle mode - always valid
-                return True
-        except Exception:
-            return False
-    
+            qx, qy, qz = component_q_to_instrument_q(sample_mount.hkl_to_q(H, K, L))
+        except (TypeError, ValueError):
+            return None
+        return (qx, qy, qz, scan_point[3])
+
+    @staticmethod
+    def _scan_valid_mask(check_state, scan_mode, q_points):
+        """Reachability of each scan point, solved in one batched angle calculation.
+
+        ``q_points`` holds one ``(qx, qy, qz, deltaE)`` per point, or None for
+        a point whose Q could not be computed (invalid). Angle-mode scans set
+        the instrument angles directly, so every point counts as valid. If the
+        batched solve raises ValueError or FloatingPointError, each point is
+        re-solved with the scalar ``calculate_angles`` so one bad point cannot
+        hide every valid one.
+        """
+        if scan_mode not in ("momentum", "rlu", "orientation"):
+            return [True] * len(q_points)
+        import numpy as np
+
+        valid = [False] * len(q_points)
+        solvable = [i for i, point in enumerate(q_points) if point is not None]
+        if not solvable:
+            return valid
+        try:
+            qx, qy, qz, deltaE = np.array([q_points[i] for i in solvable], dtype=float).T
+            _, batch_valid = check_state.calculate_angles_batch(
+                qx, qy, qz, deltaE, check_state.fixed_E, check_state.K_fixed,
+                check_state.monocris, check_state.anacris
+            )
+            for i, point_valid in zip(solvable, batch_valid.tolist()):
+                valid[i] = bool(point_valid)
+        except (ValueError, FloatingPointError):
+            # A point the vectorised solve cannot handle; anything else is a
+            # bug in the batch solver and propagates.
+            for i in solvable:
+                try:
+                    _, error_flags = check_state.calculate_angles(
+                        *q_points[i], check_state.fixed_E, check_state.K_fixed,
+                        check_state.monocris, check_state.anacris
+                    )
+                    valid[i] = not error_flags
+                except (ValueError, FloatingPointError):
+                    valid[i] = False
+        return valid
+
     def _determine_scan_mode(self, cmd1: str, cmd2: str) -> str:
         """Determine the scan mode based on scan command variables.
         
@@ -3826,6 +3855,29 @@ class TAVIController(QObject):
         except ValueError:
             self.print_to_message_center("Invalid chi value")
     
+    def _on_dock_created(self, dock):
+        """Wire a dock the window has just built on first use."""
+        if dock is self.window.misalignment_dock:
+            self._connect_misalignment_dock(dock)
+        elif dock is self.window.reciprocal_space_dock:
+            self._connect_reciprocal_dock(dock)
+            self.emit_reciprocal_snapshot()
+
+    def _connect_reciprocal_dock(self, reciprocal_dock):
+        """Wire the reciprocal-space dock to the controller."""
+        reciprocal_dock.move_requested.connect(self.apply_reciprocal_move)
+        reciprocal_dock.live_move_requested.connect(self.apply_reciprocal_live_move)
+        reciprocal_dock.values_requested.connect(self.apply_reciprocal_values)
+        reciprocal_dock.plane_requested.connect(self.set_reciprocal_plane)
+        self.reciprocal_state_changed.connect(reciprocal_dock.set_snapshot)
+        self.reciprocal_live_result.connect(reciprocal_dock.set_live_result)
+
+    def _connect_misalignment_dock(self, dock):
+        """Wire the misalignment dock's buttons once the window has built it."""
+        dock.check_alignment_button.clicked.connect(self.on_check_alignment)
+        dock.load_hash_button.clicked.connect(self.on_load_misalignment_hash)
+        dock.clear_misalignment_button.clicked.connect(self.on_clear_misalignment)
+
     def on_load_misalignment_hash(self):
         """Handle loading misalignment from hash - apply hidden values to instrument."""
         if self.window.misalignment_dock.has_misalignment():
@@ -4346,7 +4398,10 @@ class TAVIController(QObject):
             "kappa_var": self.window.sample_dock.kappa_edit.text(),
             "psi_offset_var": self.window.sample_dock.psi_edit.text(),
             # Misalignment hash only (keeps values hidden from students)
-            "misalignment_hash_var": self.window.misalignment_dock.load_hash_edit.text(),
+            "misalignment_hash_var": (
+                self.window.misalignment_dock.load_hash_edit.text()
+                if self.window.misalignment_dock is not None else ""
+            ),
             "scan_command_var1": self.window.simulation_dock.scan_command_1_edit.text(),
             "scan_command_var2": self.window.simulation_dock.scan_command_2_edit.text(),
             "save_folder_var": self.window.data_control_dock.save_folder_edit.text(),
@@ -4564,7 +4619,7 @@ class TAVIController(QObject):
                 # Misalignment hash - decode and apply without revealing values
                 mis_hash = str(parameters.get("misalignment_hash_var", ""))
                 if mis_hash and mis_hash != "None" and mis_hash != "":
-                    self.window.misalignment_dock.load_hash_edit.setText(mis_hash)
+                    self.window.ensure_misalignment_dock().load_hash_edit.setText(mis_hash)
                     # Decode and apply the misalignment to the instrument
                     try:
                         from gui.docks.misalignment_dock import decode_misalignment
@@ -6394,7 +6449,7 @@ class TAVIController(QObject):
                     else:
                         hkl = (0.0, 0.0, 0.0)
                     if qx is not None:
-                        q0 = math.sqrt(qx * qx + qy * qy + qz * qz)
+                        q0 = math.hypot(qx, qy, qz)
                     else:
                         q0 = 0.0
 
@@ -6628,14 +6683,7 @@ class TAVIController(QObject):
         # Mapping for scannable parameters
         # Indices: 0-3: Q/HKL/angles, 4-7: bending, 8-10: sample orientation (chi, kappa, psi)
         # A3 is the calculated sample angle.  omega/psi are in-plane orientation offsets.
-        variable_to_index = {
-            'qx': 0, 'qy': 1, 'qz': 2, 'deltaE': 3,
-            'H': 0, 'K': 1, 'L': 2, 'deltaE': 3,
-            'A1': 0, 'A2': 1, 'A3': 2, 'A4': 3,
-            'omega': 10, '2theta': 1,
-            'rhm': 4, 'rvm': 5, 'rha': 6, 'rva': 7,
-            'chi': 8, 'kappa': 9, 'psi': 10
-        }
+        variable_to_index = self._SCAN_VARIABLE_TO_INDEX
         
         # Initialize scan point template
         # Extended to 11 elements: 0-3: Q/HKL/angles, 4-7: bending, 8-10: chi/kappa/psi
@@ -6693,32 +6741,16 @@ class TAVIController(QObject):
                 array_values1 = array_values1 + base_value
                 self.message_printed.emit(f"Relative scan: {variable_name1} base value = {base_value}")
             
-            valid_mask_1d = [False] * len(array_values1)
-            
+            q_points = []
             for idx, value1 in enumerate(array_values1):
                 scan_point = scan_point_template[:]
                 scan_point[variable_to_index[variable_name1]] = value1
                 scan_parameter_input.append((scan_point, idx))
+                q_points.append(
+                    self._scan_point_q(scan_point, scan_mode, scan_config.sample_mount)
+                )
 
-                if scan_mode in ("momentum", "orientation"):
-                    _, error_flags = check_state.calculate_angles(
-                        *scan_point[:4], scan_config.fixed_E, scan_config.K_fixed,
-                        scan_config.monocris, scan_config.anacris
-                    )
-                elif scan_mode == "rlu":
-                    qx, qy, qz = component_q_to_instrument_q(
-                        scan_config.sample_mount.hkl_to_q(
-                            scan_point[0], scan_point[1], scan_point[2]
-                        )
-                    )
-                    _, error_flags = check_state.calculate_angles(
-                        qx, qy, qz, scan_point[3], scan_config.fixed_E,
-                        scan_config.K_fixed, scan_config.monocris, scan_config.anacris
-                    )
-                else:
-                    error_flags = []
-
-                valid_mask_1d[idx] = not error_flags
+            valid_mask_1d = self._scan_valid_mask(check_state, scan_mode, q_points)
             
             # Initialize display dock for 1D scan
             self.scan_initialized.emit('1D', list(array_values1), valid_mask_1d,
@@ -6775,34 +6807,23 @@ class TAVIController(QObject):
                 self.message_printed.emit(f"Relative scan 2: {variable_name2} base = {base_value2}")
             
             # Build a full validity mask for display, but still enqueue every requested point.
-            valid_mask_2d = [[False] * len(array_values1) for _ in range(len(array_values2))]
-            
+            q_points = []
             for idx_y, value2 in enumerate(array_values2):
                 for idx_x, value1 in enumerate(array_values1):
                     scan_point = scan_point_template[:]
                     scan_point[variable_to_index[variable_name1]] = value1
                     scan_point[variable_to_index[variable_name2]] = value2
                     scan_parameter_input.append((scan_point, idx_x, idx_y))
+                    q_points.append(
+                        self._scan_point_q(scan_point, scan_mode, scan_config.sample_mount)
+                    )
 
-                    if scan_mode in ("momentum", "orientation"):
-                        _, error_flags = check_state.calculate_angles(
-                            *scan_point[:4], scan_config.fixed_E, scan_config.K_fixed,
-                            scan_config.monocris, scan_config.anacris
-                        )
-                    elif scan_mode == "rlu":
-                        qx, qy, qz = component_q_to_instrument_q(
-                            scan_config.sample_mount.hkl_to_q(
-                                scan_point[0], scan_point[1], scan_point[2]
-                            )
-                        )
-                        _, error_flags = check_state.calculate_angles(
-                            qx, qy, qz, scan_point[3], scan_config.fixed_E,
-                            scan_config.K_fixed, scan_config.monocris, scan_config.anacris
-                        )
-                    else:
-                        error_flags = []
-
-                    valid_mask_2d[idx_y][idx_x] = not error_flags
+            valid_flat = self._scan_valid_mask(check_state, scan_mode, q_points)
+            n_cols = len(array_values1)
+            valid_mask_2d = [
+                valid_flat[row * n_cols:(row + 1) * n_cols]
+                for row in range(len(array_values2))
+            ]
             
             # Initialize display dock for 2D scan
             self.scan_initialized.emit('2D', list(array_values1), [], variable_name1,
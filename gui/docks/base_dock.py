@@ -103,13 +103,11 @@ class BaseDockWidget(QDockWidget):
             scroll_area.setWidget(self._content_widget)
             frame_layout.addWidget(scroll_area)
         else:
-            # Content widget directly in bordered frame (for docks like output with built-in scrolling)
-            self._content_widget = QWidget()
-            self._content_layout = QVBoxLayout()
-            self._content_layout.setSpacing(8)
-            self._content_layout.setContentsMargins(0, 0, 0, 0)
-            self._content_widget.setLayout(self._content_layout)
-            frame_layout.addWidget(self._content_widget)
+            # Content goes straight into the bordered frame's layout (for docks
+            # like output with built-in scrolling); no intermediate widget needed.
+            frame_layout.setSpacing(8)
+            self._content_widget = self._bordered_frame
+            self._content_layout = frame_layout
         
         self.setWidget(self._bordered_frame)
     
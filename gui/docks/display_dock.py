@@ -35,8 +35,11 @@ class SavePlotDialog(QDialog):
         """Set up the dialog UI."""
         main_layout = QVBoxLayout(self)
         
-        # Create splitter for preview and options
+        # Create splitter for preview and options. Resize the children only on
+        # handle release: every intermediate size would re-render the preview
+        # figure through Agg.
         splitter = QSplitter(Qt.Horizontal)
+        splitter.setOpaqueResize(False)
         
         # Left side: Preview
         preview_widget = QWidget()
@@ -666,7 +669,9 @@ class DisplayDock(BaseDockWidget):
                      fontsize=12, color='gray')
         self.ax.set_xticks([])
         self.ax.set_yticks([])
-        self.canvas.draw()
+        # Idle draw: at construction the canvas is not yet at its final size, so
+        # an immediate render would be discarded by the first show/resize.
+        self.canvas.draw_idle()
         self.status_label.setText("No scan data")
     
     def _get_axis_label(self, variable_name):
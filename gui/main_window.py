@@ -1,10 +1,10 @@
 """Main Window for TAVI application with PySide6 and dockable panels."""
-import sys
 import os
 import json
-from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                                QScrollArea, QMenuBar, QMenu, QMessageBox)
-from PySide6.QtCore import Qt, QByteArray, QTimer
+import base64
+import tempfile
+from PySide6.QtWidgets import QMainWindow, QWidget, QMessageBox
+from PySide6.QtCore import Qt, QByteArray, QObject, QRunnable, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QAction, QActionGroup
 
 from gui.docks.instrument_dock import InstrumentDock
@@ -14,18 +14,127 @@ from gui.docks.unified_simulation_dock import UnifiedSimulationDock
 from gui.docks.output_dock import OutputDock
 from gui.docks.data_control_dock import DataControlDock
 from gui.docks.display_dock import DisplayDock
-from gui.docks.misalignment_dock import MisalignmentDock
 from gui.docks.ub_matrix_dock import UBMatrixDock
 from gui.docks.api_dock import ApiDock
-from gui.docks.reciprocal_space_dock import ReciprocalSpaceDock
+
+# Layout config file, in the config directory at the project root
+_LAYOUT_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "config", "view_layout.json",
+)
+
+def _read_layout_file(config_path):
+    """Read ``view_layout.json`` with the Qt state blobs already decoded.
+
+    The file stays JSON (base64 for the two ``QByteArray`` blobs) so it remains
+    a readable, hand-deletable config file like the rest of ``config/``.
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        layout_data = json.load(f)
+    if not isinstance(layout_data, dict):
+        # Treated like a corrupt file: reported, and the default layout kept.
+        raise ValueError(f"expected a JSON object, got {type(layout_data).__name__}")
+    version = layout_data.get("layout_version", 0)
+    if not isinstance(version, int):
+        raise ValueError(f"layout_version must be an integer, got {version!r}")
+    if version < 3:
+        # Version 2 files list every dock's visibility instead of the open
+        # lazy docks; the visible names serve the same purpose.
+        open_lazy_docks = [name for name, visible
+                           in layout_data.get("dock_visibility", {}).items() if visible]
+    else:
+        open_lazy_docks = layout_data.get("open_lazy_docks", [])
+    layout = {"open_lazy_docks": open_lazy_docks}
+    for name in ("window_geometry", "window_state"):
+        if name in layout_data:
+            layout[name] = QByteArray.fromBase64(layout_data[name].encode('ascii'))
+    return layout
+
+
+class _LayoutWriterSignals(QObject):
+    """Signals for :class:`_SaveLayoutRunnable` (QRunnable is not a QObject)."""
+
+    # (config_path, error message or "" on success)
+    finished = Signal(str, str)
+
+
+class _LayoutReaderSignals(QObject):
+    """Signals for :class:`_LoadLayoutRunnable`."""
+
+    loaded = Signal(object)   # decoded layout dict (see _read_layout_file)
+    failed = Signal(str)      # error message
+
+
+class _LoadLayoutRunnable(QRunnable):
+    """Read and decode the layout file on a thread-pool thread."""
+
+    def __init__(self, config_path):
+        super().__init__()
+        self.config_path = config_path
+        self.signals = _LayoutReaderSignals()
+
+    def run(self):
+        try:
+            layout = _read_layout_file(self.config_path)
+        except (OSError, ValueError) as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.loaded.emit(layout)
+
+
+class _SaveLayoutRunnable(QRunnable):
+    """Encode and write a layout snapshot on a thread-pool thread.
+
+    ``saveState()``/``saveGeometry()`` must run on the GUI thread, so the
+    window takes the raw bytes there and hands them over; the base64/JSON
+    encoding and the file write happen here.
+    """
+
+    def __init__(self, config_path, layout_version, geometry, state, open_lazy_docks):
+        super().__init__()
+        self.config_path = config_path
+        self.layout_version = layout_version
+        self.geometry = geometry
+        self.state = state
+        self.open_lazy_docks = open_lazy_docks
+        self.signals = _LayoutWriterSignals()
+
+    def run(self):
+        try:
+            layout_data = {
+                "layout_version": self.layout_version,
+                "window_geometry": base64.b64encode(self.geometry).decode('ascii'),
+                "window_state": base64.b64encode(self.state).decode('ascii'),
+                "open_lazy_docks": self.open_lazy_docks,
+            }
+            # Write to a private temp file beside the target and rename over
+            # it, so an interrupted write never leaves a truncated layout file.
+            config_dir = os.path.dirname(self.config_path)
+            os.makedirs(config_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=config_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(layout_data, f, indent=2)
+                os.replace(tmp_path, self.config_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, ValueError) as e:
+            self.signals.finished.emit(self.config_path, str(e))
+        else:
+            self.signals.finished.emit(self.config_path, "")
 
 
 class TAVIMainWindow(QMainWindow):
     """Main window for TAVI application with dockable panels."""
     
-    # Layout config file path
-    LAYOUT_CONFIG_FILE = "config/view_layout.json"
-    LAYOUT_VERSION = 2
+    # 3: dock visibility/floating left to saveState(); "open_lazy_docks" lists
+    # the lazily built docks to construct before restoring them.
+    LAYOUT_VERSION = 3
+
+    # Emitted with the dock when a lazily created panel is first materialised,
+    # so the controller can wire it up.
+    dock_created = Signal(object)
     
     def __init__(self, descriptor=None, instrument_infos=None,
                  current_instrument_id=None, save_selection=None):
@@ -48,12 +157,20 @@ class TAVIMainWindow(QMainWindow):
         # reads this after app.exec() returns to relaunch with the new instrument.
         self._restart_instrument_id = None
 
-        # Enable dock nesting for more flexible layouts
-        self.setDockNestingEnabled(True)
-        
         # Store default state for reset functionality
         self._default_state = None
         self._default_geometry = None
+        # Layout snapshot last written to (or restored from) the layout file;
+        # closing the window skips the write when nothing has changed.
+        self._saved_layout = None
+        # True from the start of the background layout read until the restored
+        # layout is recorded in _saved_layout; closing in between must not
+        # overwrite the file with the default layout.
+        self._layout_restore_pending = False
+        # Layout writes run one at a time, in the order they were requested,
+        # so a later snapshot can never be overwritten by an earlier one.
+        self._layout_writer_pool = QThreadPool(self)
+        self._layout_writer_pool.setMaxThreadCount(1)
         
         # Create dock widgets with unique object names for state persistence
         self._create_docks()
@@ -64,6 +181,11 @@ class TAVIMainWindow(QMainWindow):
         # Set up the central widget (minimal, as most content is in docks)
         self._setup_central_widget()
         
+        # Size the window before the docks are laid out so Qt performs a single
+        # layout pass at the final size; a restored geometry overrides this.
+        self.resize(1600, 900)
+        self.move(100, 100)
+        
         # Add docks to the main window
         self._setup_dock_layout()
         
@@ -73,12 +195,11 @@ class TAVIMainWindow(QMainWindow):
         # Store default layout state after initial setup
         self._store_default_state()
         
-        # Restore a saved layout when present. The default layout keeps the
+        # Restore a saved layout when present. The file is read and decoded on
+        # the thread pool while the window is set up and first painted; the
+        # result is applied on the GUI thread. The default layout keeps the
         # reciprocal-space panel closed until the user opens it from View.
         self._restore_layout_from_file()
-        
-        # Set geometry after a small delay to avoid Qt geometry warnings
-        QTimer.singleShot(0, lambda: self.setGeometry(100, 100, 1600, 900))
     
     def _create_docks(self):
         """Create all dock widgets."""
@@ -91,22 +212,14 @@ class TAVIMainWindow(QMainWindow):
         # Sample Panel (column 2, top)
         self.sample_dock = UnifiedSampleDock(self, descriptor=self.descriptor)
         
-        # Misalignment Training Panel (initially hidden, opened from Sample panel)
-        self.misalignment_dock = MisalignmentDock(self)
-        # Prefer it to open as a floating panel and start hidden
-        try:
-            self.misalignment_dock.setFloating(True)
-            self.misalignment_dock.setVisible(False)
-        except Exception:
-            pass
+        # Misalignment Training Panel: built on first use (opened from the
+        # Sample panel) by ensure_misalignment_dock(); most sessions never need it.
+        self.misalignment_dock = None
         
         # UB Matrix Panel (initially hidden, opened from Sample panel)
         self.ub_matrix_dock = UBMatrixDock(self)
-        try:
-            self.ub_matrix_dock.setFloating(True)
-            self.ub_matrix_dock.setVisible(False)
-        except Exception:
-            pass
+        self.ub_matrix_dock.setFloating(True)
+        self.ub_matrix_dock.setVisible(False)
         
         # Simulation Panel (column 2, bottom)
         self.simulation_dock = UnifiedSimulationDock(self)
@@ -116,7 +229,9 @@ class TAVIMainWindow(QMainWindow):
 
         # Interactive reciprocal-space canvas.  It is a normal dock so users
         # can tab, float, maximise, and persist it with the existing layout.
-        self.reciprocal_space_dock = ReciprocalSpaceDock(self)
+        # Closed by default, so it is built by ensure_reciprocal_space_dock()
+        # the first time it is opened.
+        self.reciprocal_space_dock = None
         
         # Message Panel (column 3, middle)
         self.output_dock = OutputDock(self)
@@ -132,15 +247,38 @@ class TAVIMainWindow(QMainWindow):
             self.instrument_dock,
             self.scattering_dock,
             self.sample_dock,
-            self.misalignment_dock,
             self.ub_matrix_dock,
             self.simulation_dock,
             self.display_dock,
-            self.reciprocal_space_dock,
             self.output_dock,
             self.data_control_dock,
             self.api_dock,
         ]
+        # objectName -> dock, for restoring per-dock entries from the layout file
+        self._docks_by_name = {dock.objectName(): dock for dock in self._all_docks}
+        # Docks that are only constructed on demand: objectName -> (View-menu
+        # title, factory). Until built, the View menu holds a placeholder action.
+        self._dock_factories = {
+            "MisalignmentDock": ("Misalignment Training", self.ensure_misalignment_dock),
+            "ReciprocalSpaceDock": ("Reciprocal Space", self.ensure_reciprocal_space_dock),
+        }
+        # View-menu panel order; lazy docks are listed by objectName and keep
+        # this slot whether the menu holds their placeholder or their toggle.
+        self._view_menu_panels = [
+            self.instrument_dock,
+            self.scattering_dock,
+            self.sample_dock,
+            "MisalignmentDock",
+            self.ub_matrix_dock,
+            self.simulation_dock,
+            self.display_dock,
+            "ReciprocalSpaceDock",
+            self.output_dock,
+            self.data_control_dock,
+            self.api_dock,
+        ]
+        self._view_menu = None
+        self._lazy_dock_actions = {}
     
     def _connect_dock_signals(self):
         """Connect signals between docks."""
@@ -149,11 +287,6 @@ class TAVIMainWindow(QMainWindow):
             self._on_open_misalignment_dock
         )
         
-        # Connect misalignment dock signal to update sample dock indicator
-        self.misalignment_dock.misalignment_changed.connect(
-            self.sample_dock.update_misalignment_indicator
-        )
-        
         # Connect sample dock button to open UB matrix dock
         self.sample_dock.open_ub_matrix_dock_requested.connect(
             self._on_open_ub_matrix_dock
@@ -164,12 +297,68 @@ class TAVIMainWindow(QMainWindow):
             self.sample_dock.update_ub_indicator
         )
     
+    def ensure_misalignment_dock(self):
+        """Return the misalignment dock, constructing it on first use."""
+        if self.misalignment_dock is not None:
+            return self.misalignment_dock
+
+        from gui.docks.misalignment_dock import MisalignmentDock
+        dock = MisalignmentDock(self)
+        self.misalignment_dock = dock
+        # Use the placement from the restored layout when it has one; otherwise
+        # prefer a floating panel that starts hidden.
+        if not self.restoreDockWidget(dock):
+            self.addDockWidget(Qt.RightDockWidgetArea, dock)
+            dock.setFloating(True)
+            dock.setVisible(False)
+
+        # Update the sample dock indicator when the misalignment changes
+        dock.misalignment_changed.connect(self.sample_dock.update_misalignment_indicator)
+
+        self._register_lazy_dock(dock)
+        return dock
+
+    def ensure_reciprocal_space_dock(self):
+        """Return the reciprocal-space dock, constructing it on first use."""
+        if self.reciprocal_space_dock is not None:
+            return self.reciprocal_space_dock
+
+        from gui.docks.reciprocal_space_dock import ReciprocalSpaceDock
+        dock = ReciprocalSpaceDock(self)
+        self.reciprocal_space_dock = dock
+        # Default placement: tabbed behind the Display panel.
+        if not self.restoreDockWidget(dock):
+            self.tabifyDockWidget(self.display_dock, dock)
+            self.display_dock.raise_()
+            dock.setVisible(False)
+
+        self._register_lazy_dock(dock)
+        return dock
+
+    def _register_lazy_dock(self, dock):
+        """Track a freshly built lazy dock and swap in its View-menu toggle."""
+        self._all_docks.append(dock)
+        self._docks_by_name[dock.objectName()] = dock
+        placeholder = self._lazy_dock_actions.pop(dock.objectName(), None)
+        if placeholder is not None:
+            self._view_menu.insertAction(placeholder, dock.toggleViewAction())
+            self._view_menu.removeAction(placeholder)
+        self.dock_created.emit(dock)
+
+    def _open_lazy_dock(self, name):
+        """Build a lazy dock from its View-menu placeholder and show it."""
+        _title, factory = self._dock_factories[name]
+        dock = factory()
+        dock.setVisible(True)
+        dock.raise_()
+
     def _on_open_misalignment_dock(self):
         """Handle request to open the misalignment dock."""
         # Show and raise the misalignment dock
-        self.misalignment_dock.setVisible(True)
-        self.misalignment_dock.raise_()
-        self.misalignment_dock.activateWindow()
+        dock = self.ensure_misalignment_dock()
+        dock.setVisible(True)
+        dock.raise_()
+        dock.activateWindow()
     
     def _on_open_ub_matrix_dock(self):
         """Handle request to open the UB matrix dock."""
@@ -201,14 +390,17 @@ class TAVIMainWindow(QMainWindow):
         │             │             │   Control   │
         └─────────────┴─────────────┴─────────────┘
         """
-        # Step 1: Add all docks to the left area first
+        # Enable dock nesting for more flexible layouts
+        self.setDockOptions(self.dockOptions() | QMainWindow.AllowNestedDocks)
+        # Build the whole arrangement with updates off so it settles once
+        self.setUpdatesEnabled(False)
+
+        # Step 1: Seed the left area with the first column and the plot panel.
+        # splitDockWidget() inserts the remaining docks relative to these, so
+        # they need no addDockWidget() of their own (that would lay them out
+        # once only for the split to tear it down again).
         self.addDockWidget(Qt.LeftDockWidgetArea, self.instrument_dock)
-        self.addDockWidget(Qt.LeftDockWidgetArea, self.sample_dock)
         self.addDockWidget(Qt.LeftDockWidgetArea, self.display_dock)
-        self.addDockWidget(Qt.LeftDockWidgetArea, self.reciprocal_space_dock)
-        self.tabifyDockWidget(self.display_dock, self.reciprocal_space_dock)
-        self.display_dock.raise_()
-        self.reciprocal_space_dock.setVisible(False)
         
         # Step 2: Create 3 columns by splitting horizontally
         # Split instrument from sample (instrument stays left, sample goes right)
@@ -218,19 +410,15 @@ class TAVIMainWindow(QMainWindow):
         
         # Step 3: Add bottom docks to each column
         # Scattering below Instrument (column 1)
-        self.addDockWidget(Qt.LeftDockWidgetArea, self.scattering_dock)
         self.splitDockWidget(self.instrument_dock, self.scattering_dock, Qt.Vertical)
         
         # Simulation below Sample (column 2)
-        self.addDockWidget(Qt.LeftDockWidgetArea, self.simulation_dock)
         self.splitDockWidget(self.sample_dock, self.simulation_dock, Qt.Vertical)
         
         # Output below Display (column 3)
-        self.addDockWidget(Qt.RightDockWidgetArea, self.output_dock)
         self.splitDockWidget(self.display_dock, self.output_dock, Qt.Vertical)
         
         # Data Control below Output (column 3)
-        self.addDockWidget(Qt.RightDockWidgetArea, self.data_control_dock)
         self.splitDockWidget(self.output_dock, self.data_control_dock, Qt.Vertical)
 
         # Remote API tabbed with Data Control (column 3, bottom)
@@ -238,7 +426,8 @@ class TAVIMainWindow(QMainWindow):
         self.tabifyDockWidget(self.data_control_dock, self.api_dock)
         self.data_control_dock.raise_()
 
-        # Misalignment dock is added and configured elsewhere to avoid duplicate layout entries.
+        # Misalignment and Reciprocal Space docks are placed by their lazy
+        # factories (ensure_misalignment_dock / ensure_reciprocal_space_dock).
         
         # Step 4: Set column widths
         self.resizeDocks(
@@ -247,26 +436,18 @@ class TAVIMainWindow(QMainWindow):
             Qt.Horizontal
         )
         
-        # Step 5: Set row heights within each column
+        # Step 5: Set row heights within each column in one pass. Sample is
+        # kept shorter and Simulation taller to better use vertical space.
         self.resizeDocks(
-            [self.instrument_dock, self.scattering_dock],
-            [400, 400],
-            Qt.Vertical
-        )
-        
-        # Make Sample shorter and Simulation taller to better use vertical space
-        self.resizeDocks(
-            [self.sample_dock, self.simulation_dock],
-            [300, 500],
-            Qt.Vertical
-        )
-        
-        self.resizeDocks(
-            [self.display_dock, self.output_dock, self.data_control_dock],
-            [350, 350, 150],
+            [self.instrument_dock, self.scattering_dock,
+             self.sample_dock, self.simulation_dock,
+             self.display_dock, self.output_dock, self.data_control_dock],
+            [400, 400, 300, 500, 350, 350, 150],
             Qt.Vertical
         )
 
+        self.setUpdatesEnabled(True)
+
     
     def _create_menus(self):
         """Create the menu bar with View menu for dock management."""
@@ -274,39 +455,36 @@ class TAVIMainWindow(QMainWindow):
         
         # ===== File Menu =====
         file_menu = menubar.addMenu("&File")
-        
-        quit_action = QAction("&Quit", self)
-        quit_action.setShortcut("Ctrl+Q")
-        quit_action.triggered.connect(self.close)
-        file_menu.addAction(quit_action)
+        self._add_menu_actions(file_menu, [
+            ("&Quit", "Ctrl+Q", self.close),
+        ])
         
         # ===== View Menu =====
         view_menu = menubar.addMenu("&View")
         
-        # Add toggle actions for each dock (using built-in toggleViewAction)
+        # Add toggle actions for each dock (using built-in toggleViewAction);
+        # docks built on first use get a placeholder until they exist
         view_menu.addSection("Panels")
-        for dock in self._all_docks:
-            view_menu.addAction(dock.toggleViewAction())
-        
-        view_menu.addSeparator()
-        
-        # Restore All Docks action
-        restore_all_action = QAction("&Restore All Panels", self)
-        restore_all_action.setShortcut("Ctrl+Shift+R")
-        restore_all_action.triggered.connect(self.restore_all_docks)
-        view_menu.addAction(restore_all_action)
-        
-        # Reset to Default Layout action
-        reset_layout_action = QAction("Reset to &Default Layout", self)
-        reset_layout_action.triggered.connect(self.reset_to_default_layout)
-        view_menu.addAction(reset_layout_action)
-        
-        view_menu.addSeparator()
-        
-        # Save Current Layout action
-        save_layout_action = QAction("&Save Current Layout", self)
-        save_layout_action.triggered.connect(self.save_layout_to_file)
-        view_menu.addAction(save_layout_action)
+        self._view_menu = view_menu
+        for entry in self._view_menu_panels:
+            dock = self._docks_by_name.get(entry) if isinstance(entry, str) else entry
+            if dock is not None:
+                view_menu.addAction(dock.toggleViewAction())
+                continue
+            title, _factory = self._dock_factories[entry]
+            action = QAction(title, self, checkable=True)
+            action.triggered.connect(lambda _checked=False, n=entry: self._open_lazy_dock(n))
+            view_menu.addAction(action)
+            self._lazy_dock_actions[entry] = action
+        
+        # Layout actions (None adds a separator)
+        self._add_menu_actions(view_menu, [
+            None,
+            ("&Restore All Panels", "Ctrl+Shift+R", self.restore_all_docks),
+            ("Reset to &Default Layout", None, self.reset_to_default_layout),
+            None,
+            ("&Save Current Layout", None, self.save_layout_to_file),
+        ])
         
         # ===== Instrument Menu =====
         # Only shown when the launcher supplied the registered-instrument list.
@@ -331,21 +509,29 @@ class TAVIMainWindow(QMainWindow):
 
         # ===== Utilities Menu =====
         utilities_menu = menubar.addMenu("&Utilities")
-
-        resolution_action = QAction("&Resolution calculator…", self)
-        resolution_action.triggered.connect(self._open_resolution_dialog)
-        utilities_menu.addAction(resolution_action)
-
-        benchmark_action = QAction("&Scan-time benchmark…", self)
-        benchmark_action.triggered.connect(self._open_benchmark_dialog)
-        utilities_menu.addAction(benchmark_action)
+        self._add_menu_actions(utilities_menu, [
+            ("&Resolution calculator…", None, self._open_resolution_dialog),
+            ("&Scan-time benchmark…", None, self._open_benchmark_dialog),
+        ])
 
         # ===== Help Menu =====
         help_menu = menubar.addMenu("&Help")
-
-        about_action = QAction("&About TAVI", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        self._add_menu_actions(help_menu, [
+            ("&About TAVI", None, self._show_about),
+        ])
+
+    def _add_menu_actions(self, menu, entries):
+        """Add ``(text, shortcut, slot)`` actions to *menu*; ``None`` adds a separator."""
+        for entry in entries:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            text, shortcut, slot = entry
+            action = QAction(text, self)
+            if shortcut:
+                action.setShortcut(shortcut)
+            action.triggered.connect(slot)
+            menu.addAction(action)
 
     def _on_instrument_selected(self, instrument_id):
         """Handle an Instrument-menu selection: confirm and restart, or revert."""
@@ -434,101 +620,150 @@ class TAVIMainWindow(QMainWindow):
     
     def restore_all_docks(self):
         """Show every panel, docking standard panels and floating Reciprocal Space."""
-        for dock in self._all_docks:
-            dock.setVisible(True)
-            if dock is not self.reciprocal_space_dock:
-                dock.setFloating(False)
-        self._show_reciprocal_window()
+        # Show and re-dock everything as one repaint rather than one per dock
+        self.setUpdatesEnabled(False)
+        try:
+            for _title, factory in self._dock_factories.values():
+                factory()
+            for dock in self._all_docks:
+                dock.setVisible(True)
+                if dock is not self.reciprocal_space_dock:
+                    dock.setFloating(False)
+            self._show_reciprocal_window()
+        finally:
+            self.setUpdatesEnabled(True)
         self.statusBar().showMessage("All panels restored", 3000)
     
     def reset_to_default_layout(self):
         """Reset the dock layout to the default arrangement."""
-        if self._default_state is not None:
-            self.restoreState(self._default_state)
-        if self._default_geometry is not None:
-            self.restoreGeometry(self._default_geometry)
+        self.setUpdatesEnabled(False)
+        try:
+            if self._default_state is not None:
+                self.restoreState(self._default_state)
+            # Lazily built docks are not in the default state; they start closed.
+            for name in self._dock_factories:
+                dock = self._docks_by_name.get(name)
+                if dock is not None:
+                    dock.setVisible(False)
+            if self._default_geometry is not None:
+                self.restoreGeometry(self._default_geometry)
+        finally:
+            self.setUpdatesEnabled(True)
         self.statusBar().showMessage("Layout reset to default", 3000)
     
     def save_layout_to_file(self):
-        """Save the current layout to a JSON config file."""
+        """Save the current layout to a JSON config file.
+
+        The Qt state is captured here; encoding and writing run on the window's
+        single-thread writer pool and report back through
+        :meth:`_on_layout_saved`.
+        """
         config_path = self._get_layout_config_path()
-        
-        try:
-            layout_data = {
-                "layout_version": self.LAYOUT_VERSION,
-                "window_geometry": self.saveGeometry().toBase64().data().decode('ascii'),
-                "window_state": self.saveState().toBase64().data().decode('ascii'),
-                "dock_visibility": {
-                    dock.objectName(): dock.isVisible() for dock in self._all_docks
-                },
-                "dock_floating": {
-                    dock.objectName(): dock.isFloating() for dock in self._all_docks
-                }
-            }
-            
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(layout_data, f, indent=2)
-            
+        self._saved_layout = self._layout_snapshot()
+        writer = _SaveLayoutRunnable(config_path, self.LAYOUT_VERSION, *self._saved_layout)
+        writer.signals.finished.connect(self._on_layout_saved)
+        self._layout_writer_pool.start(writer)
+        return True
+
+    def _layout_snapshot(self):
+        """Return (geometry, state, open lazy docks) for the layout file.
+
+        ``saveState()`` already records every dock's visibility, floating state
+        and placement by objectName. The only extra is which lazily built docks
+        were open, since those must exist before restoreDockWidget() can place
+        them on the next launch.
+        """
+        return (
+            bytes(self.saveGeometry()),
+            bytes(self.saveState()),
+            [name for name in self._dock_factories
+             if name in self._docks_by_name and self._docks_by_name[name].isVisible()],
+        )
+
+    def _on_layout_saved(self, config_path, error):
+        """Report the result of a background layout write."""
+        if not error:
             self.statusBar().showMessage(f"Layout saved to {config_path}", 3000)
-            return True
-        except Exception as e:
-            QMessageBox.warning(self, "Save Layout Error", 
-                              f"Failed to save layout: {e}")
-            return False
+        elif self.isVisible():
+            QMessageBox.warning(self, "Save Layout Error",
+                              f"Failed to save layout: {error}")
+        else:
+            print(f"Warning: Failed to save layout: {error}")
     
     def _restore_layout_from_file(self):
-        """Restore layout from the JSON config file if it exists."""
+        """Start restoring the layout from the JSON config file if it exists.
+
+        Reading and decoding run on the global thread pool; :meth:`_apply_layout`
+        applies the result on the GUI thread.
+        """
         config_path = self._get_layout_config_path()
         
         if not os.path.exists(config_path):
             return False
         
+        reader = _LoadLayoutRunnable(config_path)
+        reader.signals.loaded.connect(self._apply_layout)
+        reader.signals.failed.connect(self._on_layout_restore_failed)
+        self._layout_restore_pending = True
+        QThreadPool.globalInstance().start(reader)
+        return True
+
+    def _on_layout_restore_failed(self, error):
+        """Report a layout file that could not be read."""
+        self._layout_restore_pending = False
+        print(f"Warning: Failed to restore layout: {error}")
+
+    def _apply_layout(self, layout):
+        """Apply a decoded layout (from :func:`_read_layout_file`)."""
+        # Apply geometry, dock positions and visibility as one repaint
+        self.setUpdatesEnabled(False)
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                layout_data = json.load(f)
-            
             # Restore window geometry
-            if "window_geometry" in layout_data:
-                geometry_bytes = QByteArray.fromBase64(
-                    layout_data["window_geometry"].encode('ascii')
-                )
-                self.restoreGeometry(geometry_bytes)
+            if "window_geometry" in layout:
+                self.restoreGeometry(layout["window_geometry"])
             
             # Restore window state (dock positions)
-            if "window_state" in layout_data:
-                state_bytes = QByteArray.fromBase64(
-                    layout_data["window_state"].encode('ascii')
-                )
-                self.restoreState(state_bytes)
+            if "window_state" in layout:
+                self.restoreState(layout["window_state"])
             
-            # Restore dock visibility
-            if "dock_visibility" in layout_data:
-                for dock in self._all_docks:
-                    name = dock.objectName()
-                    if name in layout_data["dock_visibility"]:
-                        dock.setVisible(layout_data["dock_visibility"][name])
-            return True
-        except Exception as e:
-            print(f"Warning: Failed to restore layout: {e}")
+            # Build the lazy docks that were open; each takes its saved
+            # placement through restoreDockWidget()
+            for name in layout["open_lazy_docks"]:
+                if name in self._dock_factories:
+                    self._dock_factories[name][1]()
+        finally:
+            self.setUpdatesEnabled(True)
+        # Snapshot once the restored layout has settled, so an untouched
+        # session does not rewrite the file on close.
+        QTimer.singleShot(0, self._remember_saved_layout)
+
+    def _layout_needs_save(self):
+        """Whether the current layout differs from the one in the layout file.
+
+        While a restore is pending the window still shows the default
+        arrangement and the file holds the layout being loaded, so there is
+        nothing to save. Otherwise ``_saved_layout`` is the restored (or last
+        written) layout; it is None only when no layout file was read.
+        """
+        if self._layout_restore_pending:
             return False
+        return self._layout_snapshot() != self._saved_layout
+
+    def _remember_saved_layout(self):
+        """Record the current layout as matching the layout file."""
+        self._saved_layout = self._layout_snapshot()
+        self._layout_restore_pending = False
 
     def _show_reciprocal_window(self):
         """Show the reciprocal-space canvas as a usable floating workspace."""
-        dock = getattr(self, "reciprocal_space_dock", None)
-        if dock is None:
-            return
+        dock = self.ensure_reciprocal_space_dock()
         dock.setFloating(True)
         dock.resize(1100, 750)
         dock.setVisible(True)
     
     def _get_layout_config_path(self):
         """Get the path to the layout config file."""
-        # Store in config directory at project root
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        config_dir = os.path.join(project_root, "config")
-        # Create config directory if it doesn't exist
-        os.makedirs(config_dir, exist_ok=True)
-        return os.path.join(project_root, self.LAYOUT_CONFIG_FILE)
+        return _LAYOUT_CONFIG_PATH
     
     def _show_about(self):
         """Show the About dialog."""
@@ -547,17 +782,8 @@ class TAVIMainWindow(QMainWindow):
             self.controller.print_to_message_center("Window closing - stopping simulation...")
             if hasattr(self.controller, 'shutdown'):
                 self.controller.shutdown()
-        self.save_layout_to_file()
+        if self._layout_needs_save():
+            self.save_layout_to_file()
+            # Let the background layout write land before the application exits.
+            self._layout_writer_pool.waitForDone(1000)
         event.accept()
-
-
-def main():
-    """Main entry point for the application."""
-    app = QApplication(sys.argv)
-    window = TAVIMainWindow()
-    window.show()
-    sys.exit(app.exec())
-
-
-if __name__ == "__main__":
-    main()
@@ -19,6 +19,7 @@ Targets Python 3.11 syntax.
 """
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
@@ -38,9 +39,41 @@ if TYPE_CHECKING:  # avoid importing heavy modules just for type hints
 InstrumentState = Any
 
 # Default MPI worker count for a McStas point run. There is no GUI knob for this
-# today; the fan-out width is fixed here and referenced by the run-point sites
-# (and recorded on mcstas scan records for future-proofing).
-DEFAULT_MPI_COUNT = 30
+# today; the fan-out width is resolved once here and referenced by the run-point
+# sites (and recorded on mcstas scan records for future-proofing).
+MPI_COUNT_ENV = "TAVI_MPI"
+MPI_COUNT_MAX_ENV = "TAVI_MPI_MAX"
+# Cap on the automatic width. os.cpu_count() counts logical (SMT) cores, so an
+# uncapped default oversubscribes large hosts; 30 is also the width every
+# earlier mcstas runtime record was taken at, and the runtime tracker matches
+# estimates on mpi_count.
+MPI_COUNT_CAP = 30
+
+
+def _positive_int_env(name):
+    """``$name`` as a positive int, or None when unset or not a positive int."""
+    try:
+        value = int(os.environ.get(name, ""))
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def default_mpi_count():
+    """MPI worker count for McStas point runs.
+
+    ``$TAVI_MPI`` (a positive integer) sets the width outright. Otherwise the
+    host's CPU count is used, capped at ``$TAVI_MPI_MAX`` if set, else at
+    :data:`MPI_COUNT_CAP` -- a fixed width oversubscribes small machines.
+    """
+    requested = _positive_int_env(MPI_COUNT_ENV)
+    if requested is not None:
+        return requested
+    cap = _positive_int_env(MPI_COUNT_MAX_ENV) or MPI_COUNT_CAP
+    return min(os.cpu_count() or 1, cap)
+
+
+DEFAULT_MPI_COUNT = default_mpi_count()
 
 
 @dataclass
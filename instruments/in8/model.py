@@ -20,6 +20,7 @@ import os
 
 import mcstasscript as ms
 
+from instruments.contract import DEFAULT_MPI_COUNT
 from instruments.paths import COMPONENTS_DIR
 from instruments.tas_runtime import (
     TAS_Instrument,
@@ -27,6 +28,7 @@ from instruments.tas_runtime import (
     run_tas_point,  # noqa: F401  (re-export: the IN8 plugin's run path)
 )
 from tavi.instrument_helpers import (
+    crystal_array_extent,
     crystal_info_from_descriptor,
     emit_collimator,
     emit_crystal_assembly,
@@ -112,7 +114,8 @@ class IN8_Instrument(TAS_Instrument):
         rha = rhafac * 2 * ana_focus / sin_ath
         rva = 2 * ana_focus * sin_ath
 
-        print(f"\nrhm: {rhm:.2f} rvm: {rvm:.2f} rha: {rha:.2f} rva: {rva:.2f}")
+        if self.verbose:
+            print(f"\nrhm: {rhm:.2f} rvm: {rvm:.2f} rha: {rha:.2f} rva: {rva:.2f}")
         return rhm, rvm, rha, rva
 
     def build_point_params(self, deltaE):
@@ -173,7 +176,7 @@ def build_IN8_instrument(in8_config, diagnostic_mode, diagnostic_settings, numbe
     instrument.add_parameter("sbl_hgap_param", comment="Pre-sample slit vertical gap (m).")
     instrument.add_parameter("dbl_hgap_param", comment="Detector slit horizontal gap (m).")
 
-    monochromator_info, analyzer_info = IN8.crystal_info(IN8.monocris, IN8.anacris)
+    monochromator_info, analyzer_info = IN8.cached_crystal_info(IN8.monocris, IN8.anacris)
 
     from instruments.in8.plugin import _IN8_MONITORS
     from tavi.sample_library import default_sample_library
@@ -190,10 +193,7 @@ def build_IN8_instrument(in8_config, diagnostic_mode, diagnostic_settings, numbe
 
         ## source-to-monochromator
 
-        mono_width = monochromator_info['slabwidth'] * monochromator_info['ncolumns'] \
-            + monochromator_info['gap'] * (monochromator_info['ncolumns'] - 1)
-        mono_height = monochromator_info['slabheight'] * monochromator_info['nrows'] \
-            + monochromator_info['gap'] * (monochromator_info['nrows'] - 1)
+        mono_width, mono_height = crystal_array_extent(monochromator_info)
 
         # The source sits AT the horizontal virtual source (an adjustable slit
         # in reality); its aperture is the HVS opening, illuminating the full
@@ -319,7 +319,7 @@ def build_IN8_instrument(in8_config, diagnostic_mode, diagnostic_settings, numbe
         instrument.settings(
             output_path="./output",
             ncount=number_neutrons,
-            mpi=30,
+            mpi=DEFAULT_MPI_COUNT,
             force_compile=True,
             increment_folder_name=False,
             openacc=False,
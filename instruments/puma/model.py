@@ -3,13 +3,16 @@ from __future__ import annotations
 
 import math
 import os
+from functools import lru_cache
 
 import mcstasscript as ms
 
+from instruments.contract import DEFAULT_MPI_COUNT
 from instruments.paths import COMPONENTS_DIR
 from instruments.tas_runtime import TAS_Instrument
 from tavi.neutron_conversions import energy2lambda
 from tavi.instrument_helpers import (
+    crystal_array_extent,
     crystal_info_from_descriptor,
     crystal_spec_to_info as _crystal_spec_to_info,
     find_crystal_spec as _find_crystal_spec,
@@ -18,16 +21,26 @@ from tavi.instrument_helpers import (
 data_dir = COMPONENTS_DIR
 MCSTAS_NAME = "PUMA_McScript"
 
+@lru_cache(maxsize=32)
+def _descriptor_crystal_info(monocris, anacris):
+    """Memoized descriptor lookup behind :func:`mono_ana_crystals_setup`."""
+    from instruments.puma.plugin import puma_descriptor
+
+    return crystal_info_from_descriptor(puma_descriptor(), monocris, anacris)
+
+
 def mono_ana_crystals_setup(monocris, anacris):
     """Crystal parameter dicts for the mono/analyzer, sourced from the descriptor.
 
     The descriptor (instruments/puma/plugin.py) is the single source of truth for
     crystal data; lookups are by CrystalSpec id ("pg002"). Unknown ids return
     empty dicts.
-    """
-    from instruments.puma.plugin import puma_descriptor
 
-    return crystal_info_from_descriptor(puma_descriptor(), monocris, anacris)
+    Called on every angle/Q calculation, so the descriptor lookup is memoized
+    per id pair; callers get their own (plain, picklable) copies of the dicts.
+    """
+    monochromator_info, analyzer_info = _descriptor_crystal_info(monocris, anacris)
+    return dict(monochromator_info), dict(analyzer_info)
 
 ## This function adds a Union material with incoherent scattering and powder lines
 def add_union_powder(name, data_name, sigma_inc, sigma_abs, unit_V, instr):
@@ -112,17 +125,21 @@ class PUMA_Instrument(TAS_Instrument):
         For analyzer: Uses point-source formula with L = 1/(1/L3 + 1/L4) since
         the sample is a real point source.
         """
+        sin_mth = math.sin(math.radians(mth))
+        sin_ath = math.sin(math.radians(ath))
+
         # Monochromator: parallel beam formula (source at infinity from guide)
         # RH = 2*L2/sin(theta), RV = 2*L2*sin(theta)
-        rhm = rhmfac * 2 * self.L2 / math.sin(math.radians(mth))
-        rvm = rvmfac * 2 * self.L2 * math.sin(math.radians(mth))
+        rhm = rhmfac * 2 * self.L2 / sin_mth
+        rvm = rvmfac * 2 * self.L2 * sin_mth
         
         # Analyzer: point-source formula (sample is real source)
         # RH = 2/sin(theta)/(1/L3 + 1/L4), RV = 2*sin(theta)/(1/L3 + 1/L4)
-        rha = rhafac * 2 / math.sin(math.radians(ath)) / (1/self.L3 + 1/self.L4)
+        rha = rhafac * 2 / sin_ath / (1/self.L3 + 1/self.L4)
         rva = 0.8 # Said to be fixed at 0.8 m
 
-        print(f"\nrhm: {rhm:.2f} rvm: {rvm:.2f} rha: {rha:.2f} rva: {rva:.2f}")
+        if self.verbose:
+            print(f"\nrhm: {rhm:.2f} rvm: {rvm:.2f} rha: {rha:.2f} rva: {rva:.2f}")
 
         if rhm < 2.0 and rhmfac != 0:
             print("\nRequested Rh (mono) is {:.2f} m, but minimum Rh is 2.0 m".format(rhm))
@@ -243,7 +260,7 @@ def build_PUMA_instrument(puma_config, diagnostic_mode, diagnostic_settings, num
     
 
     # Monochromator crystal
-    monochromator_info, analyzer_info = mono_ana_crystals_setup(PUMA.monocris, PUMA.anacris)
+    monochromator_info, analyzer_info = PUMA.cached_crystal_info(PUMA.monocris, PUMA.anacris)
 
     # Diagnostic monitors are emitted from the descriptor table at the exact
     # insertion points below (component order is physics in McStas). The
@@ -288,8 +305,7 @@ def build_PUMA_instrument(puma_config, diagnostic_mode, diagnostic_settings, num
 
         ## source-to-monochromator
 
-        mono_width = monochromator_info['slabwidth']*monochromator_info['ncolumns'] + monochromator_info['gap']*(monochromator_info['ncolumns']-1)
-        mono_height  =  monochromator_info['slabheight']*monochromator_info['nrows'] + monochromator_info['gap']*(monochromator_info['nrows']-1)
+        mono_width, mono_height = crystal_array_extent(monochromator_info)
 
         source = instrument.add_component("source", "Source_div_Maxwellian_v2")
         source.xwidth= PUMA.hbl_hgap
@@ -473,7 +489,7 @@ def build_PUMA_instrument(puma_config, diagnostic_mode, diagnostic_settings, num
         #   - r_0 corresponds to vertical beam half-height (79mm/2 = 39.5mm)
         #   - mirror_sidelength is horizontal beam width (67mm)
         #
-        if PUMA.NMO_installed == "Vertical" or PUMA.NMO_installed == "Both":
+        if PUMA.NMO_installed in ("Vertical", "Both"):
             vertical_focusing_NMO = instrument.add_component(
                 "vertical_focusing_NMO", 
                 "FlatEllipse_finite_mirror_optimized", 
@@ -511,7 +527,7 @@ def build_PUMA_instrument(puma_config, diagnostic_mode, diagnostic_settings, num
         # Placement: downstream of vertical NMO by mirror_length + gap
         # to avoid physical overlap when both are installed
         #
-        if PUMA.NMO_installed == "Horizontal" or PUMA.NMO_installed == "Both":
+        if PUMA.NMO_installed in ("Horizontal", "Both"):
             # Offset only when both units are present, to place the horizontal
             # NMO after the vertical NMO without overlap.
             mirror_length = lEnd - lStart  # 0.150m
@@ -640,7 +656,7 @@ def build_PUMA_instrument(puma_config, diagnostic_mode, diagnostic_settings, num
         instrument.settings(
             output_path="./output",
             ncount=number_neutrons,
-            mpi=30,
+            mpi=DEFAULT_MPI_COUNT,
             force_compile=True,
             increment_folder_name=False,
             openacc=False,
@@ -21,6 +21,7 @@ from tavi.tas_geometry import (
     component_q_to_instrument_q,
     q_instrument_from_angles,
     solve_instrument_angles,
+    solve_instrument_angles_batch,
 )
 
 # The TAS class is a general tool for any TAS instrument
@@ -61,6 +62,14 @@ class TAS_Instrument:
         self.sample_mount = SampleMount.from_lattice_tas(4.05, 4.05, 4.05, 90, 90, 90)
         self.diagnostic_mode = False
         self.diagnostic_settings = {}
+        self.verbose = False  # print per-call angle/Q traces and solver failures
+        # Last crystal_info() result and its (monocris, anacris) key; see
+        # cached_crystal_info().
+        self._crystal_cache_key = None
+        self._crystal_cache = None
+        # Fixed-energy arm (k, unsigned two-theta) and its key; see _fixed_arm().
+        self._fixed_arm_key = None
+        self._fixed_arm_cache = None
 
     def set_parameters(self, **kwargs):
         """Method to set general parameters."""
@@ -172,6 +181,35 @@ class TAS_Instrument:
         """
         raise NotImplementedError("Instrument state must supply crystal_info().")
 
+    def cached_crystal_info(self, monocris, anacris):
+        """:meth:`crystal_info`, remembered until the crystal ids change.
+
+        The crystals are fixed for a whole scan, but the angle and Q/dE
+        calculations look them up for every point.
+        """
+        key = (monocris, anacris)
+        if key != self._crystal_cache_key:
+            self._crystal_cache = self.crystal_info(monocris, anacris)
+            self._crystal_cache_key = key
+        return self._crystal_cache
+
+    def _fixed_arm(self, fixed_E, K_fixed, monocris, anacris):
+        """(k, unsigned Bragg two-theta) of the fixed-energy arm.
+
+        The monochromator in Ki-fixed mode, the analyzer in Kf-fixed mode.
+        Both depend only on the scan settings, so they are kept until
+        ``fixed_E``, ``K_fixed`` or the crystals change. Callers must have
+        checked that the crystals resolve.
+        """
+        key = (fixed_E, K_fixed, monocris, anacris)
+        if key != self._fixed_arm_key:
+            monochromator_info, analyzer_info = self.cached_crystal_info(monocris, anacris)
+            d = monochromator_info['dm'] if K_fixed == "Ki Fixed" else analyzer_info['da']
+            k = energy2k(fixed_E)
+            self._fixed_arm_cache = (k, 2 * k2angle(k, d))
+            self._fixed_arm_key = key
+        return self._fixed_arm_cache
+
     def build_point_params(self, deltaE):
         """Return the runtime parameter dict for one instrument point."""
         raise NotImplementedError("Instrument state must supply build_point_params().")
@@ -221,47 +259,48 @@ class TAS_Instrument:
 
         # Check for zero momentum transfer early to avoid division by zero
         if qx == 0 and qy == 0 and qz == 0:
-            print("\nInvalid: zero momentum transfer (qx=qy=qz=0)")
+            if self.verbose:
+                print("\nInvalid: zero momentum transfer (qx=qy=qz=0)")
             error_flags.append("zero_q")
             return [0, 0, 0, 0, 0], error_flags
 
         # Retrieve mono/ana crystal information
-        monochromator_info, analyzer_info = self.crystal_info(monocris, anacris)
+        monochromator_info, analyzer_info = self.cached_crystal_info(monocris, anacris)
         if 'dm' not in monochromator_info or 'da' not in analyzer_info:
-            print(f"\nInvalid: unknown crystal selection (mono: {monocris}, ana: {anacris})")
+            if self.verbose:
+                print(f"\nInvalid: unknown crystal selection (mono: {monocris}, ana: {anacris})")
             error_flags.append("invalid_crystal")
             return [0, 0, 0, 0, 0], error_flags
 
-        # pre-calculate values from parameters
-        q = math.sqrt(qx**2 + qy**2 + qz**2)
-
-        K = energy2k(fixed_E)
-
         if K_fixed == "Ki Fixed":
-            mtt = self.sense_mono * 2 * k2angle(K, monochromator_info['dm'])
+            ki, fixed_two_theta = self._fixed_arm(fixed_E, K_fixed, monocris, anacris)
+            mtt = self.sense_mono * fixed_two_theta
             Ei = fixed_E
-            ki = energy2k(Ei)
             Ef = Ei - deltaE
             kf = energy2k(Ef)
             att = self.sense_ana * 2 * k2angle(kf, analyzer_info['da'])
             if math.isinf(mtt):
-                print("\nCannot compute monochromator two theta angle as momentum transfer invalid")
+                if self.verbose:
+                    print("\nCannot compute monochromator two theta angle as momentum transfer invalid")
                 error_flags.append("mtt")
             if math.isinf(att):
-                print("\nCannot compute analyzer two theta angle as momentum transfer invalid")
+                if self.verbose:
+                    print("\nCannot compute analyzer two theta angle as momentum transfer invalid")
                 error_flags.append("att")
         elif K_fixed == "Kf Fixed":
-            att = self.sense_ana * 2 * k2angle(K, analyzer_info['da'])
+            kf, fixed_two_theta = self._fixed_arm(fixed_E, K_fixed, monocris, anacris)
+            att = self.sense_ana * fixed_two_theta
             Ef = fixed_E
-            kf = energy2k(Ef)
             Ei = Ef + deltaE
             ki = energy2k(Ei)
             mtt = self.sense_mono * 2 * k2angle(ki, monochromator_info['dm'])
             if math.isinf(mtt):
-                print("\nCannot compute monochromator two theta angle as momentum transfer invalid")
+                if self.verbose:
+                    print("\nCannot compute monochromator two theta angle as momentum transfer invalid")
                 error_flags.append("mtt")
             if math.isinf(att):
-                print("\nCannot compute analyzer two theta angle as momentum transfer invalid")
+                if self.verbose:
+                    print("\nCannot compute analyzer two theta angle as momentum transfer invalid")
                 error_flags.append("att")
 
         try:
@@ -269,54 +308,92 @@ class TAS_Instrument:
                 np.array([qx, qy, qz], dtype=float), ki, kf,
                 sense_sample=self.sense_sample,
             )
-            stt = sample_angles.stt
-        except ValueError as exc:
-            print("\nSample two theta angle invalid")
-            stt = 0
+        except ValueError:
+            if self.verbose:
+                print("\nSample two theta angle invalid")
+                print("\nCannot compute sample theta angle as sample two theta angle invalid")
             error_flags.append("stt")
-            sample_angles = None
-
-        if "stt" in error_flags:
-            print("\nCannot compute sample theta angle as sample two theta angle invalid")
-            sth = 0
-            saz = 0
+            stt = sth = saz = 0
         else:
+            stt = sample_angles.stt
             sth = sample_angles.sth
             saz = sample_angles.saz
 
 
-        print(f"\nmtt: {mtt:.2f} ki: {ki:.3f} Ei: {Ei:.3f} stt: {stt:.3f} sth: {sth:.3f} saz: {saz:.3f} Q: {q:.2f} kf: {kf:.3f} Ef: {Ef:.3f} att: {att:.2f}")
+        if self.verbose:
+            q = math.hypot(qx, qy, qz)
+            print(f"\nmtt: {mtt:.2f} ki: {ki:.3f} Ei: {Ei:.3f} stt: {stt:.3f} sth: {sth:.3f} saz: {saz:.3f} Q: {q:.2f} kf: {kf:.3f} Ef: {Ef:.3f} att: {att:.2f}")
 
         angles_array = [mtt, stt, sth, saz, att]
         return(angles_array, error_flags)
 
+    def calculate_angles_batch(self, qx, qy, qz, deltaE, fixed_E, K_fixed, monocris, anacris):
+        """Vectorized :meth:`calculate_angles` over arrays of scattering points.
+
+        ``qx``/``qy``/``qz``/``deltaE`` broadcast against each other. Returns
+        ``(angles, valid)``: a (5, N) array of [mtt, stt, sth, saz, att] and a
+        boolean mask that is False wherever the scalar method would report an
+        error flag (or its angles would be non-finite). Nothing is printed, so
+        it suits validating whole scan grids.
+        """
+        qx, qy, qz, deltaE = (
+            np.ravel(a) for a in np.broadcast_arrays(
+                *(np.asarray(v, dtype=float) for v in (qx, qy, qz, deltaE))
+            )
+        )
+        n = qx.size
+
+        monochromator_info, analyzer_info = self.cached_crystal_info(monocris, anacris)
+        if (
+            'dm' not in monochromator_info or 'da' not in analyzer_info
+            or K_fixed not in ("Ki Fixed", "Kf Fixed")
+        ):
+            return np.zeros((5, n)), np.zeros(n, dtype=bool)
+
+        with np.errstate(invalid="ignore"):
+            if K_fixed == "Ki Fixed":
+                ki = np.full(n, energy2k(fixed_E))
+                kf = energy2k(fixed_E - deltaE)
+            else:
+                kf = np.full(n, energy2k(fixed_E))
+                ki = energy2k(fixed_E + deltaE)
+
+        mtt, mtt_valid = _bragg_two_theta(ki, monochromator_info['dm'], self.sense_mono)
+        att, att_valid = _bragg_two_theta(kf, analyzer_info['da'], self.sense_ana)
+        stt, sth, saz, sample_valid = solve_instrument_angles_batch(
+            np.column_stack((qx, qy, qz)), ki, kf, sense_sample=self.sense_sample,
+        )
+        return np.vstack((mtt, stt, sth, saz, att)), mtt_valid & att_valid & sample_valid
+
     def calculate_q_and_deltaE(self, mtt, stt, sth, saz, att, fixed_E, K_fixed, monocris, anacris):
         """Computes qx, qy, qz, and deltaE based on the given angles and fixed energy configuration"""
         error_flags = []
 
         # Retrieve mono/ana crystal information
-        monochromator_info, analyzer_info = self.crystal_info(monocris, anacris)
+        monochromator_info, analyzer_info = self.cached_crystal_info(monocris, anacris)
         if 'dm' not in monochromator_info or 'da' not in analyzer_info:
-            print(f"\nInvalid: unknown crystal selection (mono: {monocris}, ana: {anacris})")
+            if self.verbose:
+                print(f"\nInvalid: unknown crystal selection (mono: {monocris}, ana: {anacris})")
             error_flags.append("invalid_crystal")
             return [0, 0, 0, 0], error_flags
 
         # Calculate incident and scattered wavevectors based on the fixed energy
         if K_fixed == "Ki Fixed":
-            ki = energy2k(fixed_E)
+            ki, _ = self._fixed_arm(fixed_E, K_fixed, monocris, anacris)
             Ei = fixed_E
             kf = angle2k(att / (2 * self.sense_ana), analyzer_info['da'])  # Remove signed readout sense before Bragg inversion
             Ef = k2energy(kf)
             deltaE = Ei - Ef
         elif K_fixed == "Kf Fixed":
-            kf = energy2k(fixed_E)
+            kf, _ = self._fixed_arm(fixed_E, K_fixed, monocris, anacris)
             Ef = fixed_E
             ki = angle2k(mtt / (2 * self.sense_mono), monochromator_info['dm'])  # Remove signed readout sense before Bragg inversion
             Ei = k2energy(ki)
             deltaE = Ei - Ef
         else:
             error_flags.append("K_fixed")
-            print("Invalid K_fixed value")
+            if self.verbose:
+                print("Invalid K_fixed value")
             return [0, 0, 0, 0], error_flags
 
         # Compute Q in the public instrument/GUI convention:
@@ -330,21 +407,36 @@ class TAS_Instrument:
                 qx, qy, qz = -qx, -qy, -qz
         except Exception as exc:
             error_flags.append("q")
-            print(f"Invalid Q from sample angles: {exc}")
+            if self.verbose:
+                print(f"Invalid Q from sample angles: {exc}")
             qx = qy = qz = 0.0
 
         # Validate Q magnitude
-        q = math.sqrt(qx**2 + qy**2 + qz**2)
+        q = math.hypot(qx, qy, qz)
         if q <= 0:
             error_flags.append("q")
-            print("Invalid Q magnitude")
+            if self.verbose:
+                print("Invalid Q magnitude")
 
         # Debugging output
-        print(f"\nqx: {qx:.3f}, qy: {qy:.3f}, qz: {qz:.3f}, deltaE: {deltaE:.3f}, Q: {q:.3f}")
+        if self.verbose:
+            print(f"\nqx: {qx:.3f}, qy: {qy:.3f}, qz: {qz:.3f}, deltaE: {deltaE:.3f}, Q: {q:.3f}")
 
         return [qx, qy, qz, deltaE], error_flags
 
 
+def _bragg_two_theta(k, d, sense):
+    """Array form of ``sense * 2 * k2angle(k, d)``: (angles, valid).
+
+    Unreachable reflections are inf, as from the scalar helper.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sin_theta = np.pi / (k * d)
+        valid = np.abs(sin_theta) <= 1
+        two_theta = sense * 2 * np.degrees(np.arcsin(np.where(valid, sin_theta, 0.0)))
+    return np.where(valid, two_theta, np.inf), valid
+
+
 _ERROR_FLAG_REASONS = {
     "zero_q": "zero momentum transfer (Q = 0)",
     "invalid_crystal": "unknown monochromator/analyzer crystal selection",
@@ -207,6 +207,16 @@ def crystal_spec_to_info(spec, d_key):
     }
 
 
+def crystal_array_extent(info):
+    """(width, height) of a slab array described by a crystal-info dict.
+
+    Slabs plus the gaps between them; the source focuses on this area.
+    """
+    width = info['slabwidth'] * info['ncolumns'] + info['gap'] * (info['ncolumns'] - 1)
+    height = info['slabheight'] * info['nrows'] + info['gap'] * (info['nrows'] - 1)
+    return width, height
+
+
 def find_crystal_spec(specs, crystal_id):
     for spec in specs:
         if spec.id == crystal_id:
@@ -16,29 +16,38 @@ K_B = 0.08617333262 # Boltzmann's constant in meV/K
 HBAR_meV = 6.582119569e-13 # H-bar in meV*s
 HBAR = 1.05459e-34  #H-bar in J*s
 
+# k [1/A] <-> E [meV] conversion factors, folded once at import: E = _K2E * k**2
+_K2E = 1e3 * (1e10 * HBAR)**2 / (2 * N_MASS * E_CHARGE)
+_E2K = math.sqrt(1e-3 * E_CHARGE * 2 * N_MASS) * 1e-10 / HBAR
+# degree <-> radian factors (the ones math.degrees/math.radians multiply by)
+_RAD2DEG = 180.0 / math.pi
+_DEG2RAD = math.pi / 180.0
+
 ##  some functions to convert between energies, angles and momenta ##
 def k2angle(k, d):
     """Converts a k value to a Bragg scattering 2-theta angle"""
-    if 2*math.pi/(2*k*d)<-1 or 2*math.pi/(2*k*d)>1: #check if the angle is valid
+    sin_theta = math.pi/(k*d)
+    if not -1 <= sin_theta <= 1: #check if the angle is valid
         return(math.inf)
     else:
-        return(math.degrees(math.asin(2*math.pi/(2*k*d))))
+        return(math.asin(sin_theta) * _RAD2DEG)
 
 def angle2k(angle, d):
     """Converts a Bragg scattering 2-theta angle to a k value"""
-    if d*math.sin(math.radians(angle)) != 0:
-        return(abs(math.pi/(d*math.sin(math.radians(angle)))))
+    d_sin = d*math.sin(angle * _DEG2RAD)
+    if d_sin != 0:
+        return(abs(math.pi/d_sin))
     else:
         return(0)
 
 # neutron momentum, in A/s, is converted to meV
 def k2energy(k):
     """Converts a momentum k in A/s to energy in meV"""
-    return(1e3*math.pow((k * 1e10 * HBAR), 2) / (2 * N_MASS * E_CHARGE))
+    return(_K2E * k * k)
 
 def energy2k(energy):
     """Converts an energy in meV to a momentum k in A/s"""
-    return(np.sqrt(energy * 1e-3 * E_CHARGE * 2 * N_MASS) * 1e-10/HBAR)
+    return(_E2K * np.sqrt(energy))
 
 def energy2lambda(energy):
     """Converts an energy in meV to a wavelength lambda in A"""
@@ -9,6 +9,8 @@ from dataclasses import dataclass
 
 import numpy as np
 
+from tavi.neutron_conversions import _DEG2RAD, _RAD2DEG
+
 
 EPS = 1e-12
 
@@ -64,6 +66,7 @@ def mccode_euler_from_matrix(matrix: np.ndarray) -> tuple[float, float, float]:
     if r.shape != (3, 3):
         raise ValueError("Rotation matrix must be 3x3.")
 
+    # np.clip, unlike a min/max clamp, lets NaN through instead of making it 1.
     sy = float(np.clip(r[2, 0], -1.0, 1.0))
     ry = math.asin(sy)
     cy = math.cos(ry)
@@ -104,10 +107,10 @@ def stt_from_q_norm(q_norm: float, ki: float, kf: float, sense_sample: int = -1)
     if ki <= 0 or kf <= 0:
         raise ValueError("ki and kf must be positive.")
     cos_stt = (q_norm * q_norm - ki * ki - kf * kf) / (-2.0 * ki * kf)
-    if cos_stt < -1.0 - 1e-10 or cos_stt > 1.0 + 1e-10:
+    if not -1.0 - 1e-10 <= cos_stt <= 1.0 + 1e-10:
         raise ValueError("Sample two-theta angle invalid for Q, ki, and kf.")
-    cos_stt = float(np.clip(cos_stt, -1.0, 1.0))
-    return sense_sample * math.degrees(math.acos(cos_stt))
+    cos_stt = max(-1.0, min(1.0, float(cos_stt)))
+    return sense_sample * math.acos(cos_stt) * _RAD2DEG
 
 
 def lab_q_from_stt(ki: float, kf: float, stt_deg: float) -> np.ndarray:
@@ -181,25 +184,76 @@ def solve_instrument_angles(
     q = np.asarray(q_instrument, dtype=float)
     if q.shape != (3,):
         raise ValueError("q_instrument must be a 3-vector.")
-    q_norm = float(np.linalg.norm(q))
+    # Scalar math from here on: this runs once per point and per GUI edit,
+    # where small-array NumPy calls cost more than the arithmetic itself.
+    qx, qy, qz = q.tolist()
+    q_norm = math.hypot(qx, qy, qz)
     if q_norm <= EPS:
         raise ValueError("Zero momentum transfer is invalid.")
     if sense_sample > 0:
-        q = -q
+        qx, qy, qz = -qx, -qy, -qz
 
     stt = stt_from_q_norm(q_norm, ki, kf, sense_sample)
-    q_lab = lab_q_from_stt(ki, kf, stt)
-    phi_lab = math.atan2(q_lab[2], q_lab[0])
-    phi_target = math.atan2(q[1], q[0])
-    sth = math.degrees(phi_target - phi_lab)
+    # lab_q_from_stt, component-wise: Q_lab = (-kf sin stt, 0, ki - kf cos stt)
+    stt_rad = stt * _DEG2RAD
+    phi_lab = math.atan2(ki - kf * math.cos(stt_rad), -kf * math.sin(stt_rad))
+    phi_target = math.atan2(qy, qx)
+    sth = (phi_target - phi_lab) * _RAD2DEG
     if sense_sample > 0:
         sth = _normalize_deg(sth)
 
-    q_horizontal = math.hypot(q[0], q[1])
-    saz = -math.degrees(math.atan2(q[2], q_horizontal))
+    q_horizontal = math.hypot(qx, qy)
+    saz = -math.atan2(qz, q_horizontal) * _RAD2DEG
     return TASAngles(stt=stt, sth=sth, saz=saz)
 
 
+def solve_instrument_angles_batch(
+    q_instrument: np.ndarray, ki, kf, *, sense_sample: int = -1
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized :func:`solve_instrument_angles` over an (N, 3) array of Q.
+
+    ``ki``/``kf`` are scalars or length-N arrays. Returns ``(stt, sth, saz,
+    valid)`` arrays. Points the scalar solver would reject (zero Q,
+    non-positive k, a scattering triangle that does not close), and points
+    with non-finite input, are False in ``valid`` and carry 0 angles.
+    """
+    q = np.asarray(q_instrument, dtype=float)
+    if q.ndim != 2 or q.shape[1] != 3:
+        raise ValueError("q_instrument must be an (N, 3) array.")
+    n = q.shape[0]
+    ki = np.broadcast_to(np.asarray(ki, dtype=float), (n,))
+    kf = np.broadcast_to(np.asarray(kf, dtype=float), (n,))
+    q_norm = np.linalg.norm(q, axis=1)
+    if sense_sample > 0:
+        q = -q
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_stt = (q_norm * q_norm - ki * ki - kf * kf) / (-2.0 * ki * kf)
+        valid = (
+            (q_norm > EPS) & (ki > 0) & (kf > 0)
+            & (cos_stt >= -1.0 - 1e-10) & (cos_stt <= 1.0 + 1e-10)
+        )
+        stt = sense_sample * np.arccos(np.clip(cos_stt, -1.0, 1.0)) * _RAD2DEG
+
+        # lab_q_from_stt, component-wise: Q_lab = (-kf sin stt, 0, ki - kf cos stt)
+        stt_rad = stt * _DEG2RAD
+        phi_lab = np.arctan2(ki - kf * np.cos(stt_rad), -kf * np.sin(stt_rad))
+        phi_target = np.arctan2(q[:, 1], q[:, 0])
+        sth = (phi_target - phi_lab) * _RAD2DEG
+        if sense_sample > 0:
+            sth = (sth + 180.0) % 360.0 - 180.0
+            sth[sth == -180.0] = 180.0
+
+        saz = -np.arctan2(q[:, 2], np.hypot(q[:, 0], q[:, 1])) * _RAD2DEG
+
+    return (
+        np.where(valid, stt, 0.0),
+        np.where(valid, sth, 0.0),
+        np.where(valid, saz, 0.0),
+        valid,
+    )
+
+
 def q_sample_from_angles(sth: float, saz: float, stt: float, ki: float, kf: float) -> np.ndarray:
     """Compute mounted-sample Q from TAS sample angles."""
     q_lab = lab_q_from_stt(ki, kf, stt)
@@ -209,16 +263,20 @@ def q_sample_from_angles(sth: float, saz: float, stt: float, ki: float, kf: floa
 
 def q_instrument_from_angles(sth: float, saz: float, stt: float, ki: float, kf: float) -> np.ndarray:
     """Compute public instrument/GUI Q from TAS sample angles."""
-    q_lab = lab_q_from_stt(ki, kf, stt)
-    q_norm = float(np.linalg.norm(q_lab))
-    phi_lab = math.atan2(q_lab[2], q_lab[0])
-    phi_target = math.radians(sth) + phi_lab
-    saz_rad = math.radians(saz)
-    q_horizontal = q_norm * math.cos(saz_rad)
+    # Lab Q (lab_q_from_stt) rotated by sth and tilted by saz. Expanding
+    # cos/sin(phi_lab + sth) with phi_lab = atan2(q_lab_z, q_lab_x) cancels |Q|
+    # from the horizontal components, so no atan2 or temporary arrays.
+    stt_rad = stt * _DEG2RAD
+    q_lab_x = -kf * math.sin(stt_rad)
+    q_lab_z = ki - kf * math.cos(stt_rad)
+    sth_rad = sth * _DEG2RAD
+    cos_sth, sin_sth = math.cos(sth_rad), math.sin(sth_rad)
+    saz_rad = saz * _DEG2RAD
+    cos_saz = math.cos(saz_rad)
     return np.array([
-        q_horizontal * math.cos(phi_target),
-        q_horizontal * math.sin(phi_target),
-        -q_norm * math.sin(saz_rad),
+        cos_saz * (q_lab_x * cos_sth - q_lab_z * sin_sth),
+        cos_saz * (q_lab_z * cos_sth + q_lab_x * sin_sth),
+        -math.hypot(q_lab_x, q_lab_z) * math.sin(saz_rad),
     ], dtype=float)
 
 
@@ -0,0 +1,46 @@
+"""Shared run-execution defaults in instruments/contract.py."""
+import pytest
+
+from instruments import contract
+from instruments.contract import (
+    MPI_COUNT_CAP,
+    MPI_COUNT_ENV,
+    MPI_COUNT_MAX_ENV,
+    default_mpi_count,
+)
+
+
+@pytest.fixture
+def clean_mpi_env(monkeypatch):
+    monkeypatch.delenv(MPI_COUNT_ENV, raising=False)
+    monkeypatch.delenv(MPI_COUNT_MAX_ENV, raising=False)
+    return monkeypatch
+
+
+def test_default_mpi_count_follows_small_hosts(clean_mpi_env):
+    clean_mpi_env.setattr(contract.os, "cpu_count", lambda: 4)
+    assert default_mpi_count() == 4
+
+
+def test_default_mpi_count_is_capped_on_large_hosts(clean_mpi_env):
+    clean_mpi_env.setattr(contract.os, "cpu_count", lambda: 128)
+    assert default_mpi_count() == MPI_COUNT_CAP
+
+    clean_mpi_env.setenv(MPI_COUNT_MAX_ENV, "8")
+    assert default_mpi_count() == 8
+
+
+def test_default_mpi_count_env_override(clean_mpi_env):
+    clean_mpi_env.setattr(contract.os, "cpu_count", lambda: 128)
+    clean_mpi_env.setenv(MPI_COUNT_ENV, "64")
+    assert default_mpi_count() == 64
+
+    for bad in ("0", "-3", "many", ""):
+        clean_mpi_env.setenv(MPI_COUNT_ENV, bad)
+        clean_mpi_env.setenv(MPI_COUNT_MAX_ENV, bad)
+        assert default_mpi_count() == MPI_COUNT_CAP
+
+
+def test_default_mpi_count_without_cpu_count(clean_mpi_env):
+    clean_mpi_env.setattr(contract.os, "cpu_count", lambda: None)
+    assert default_mpi_count() == 1
@@ -0,0 +1,71 @@
+"""Dock objectName source-scan tests.
+
+``QMainWindow.saveState()``/``restoreState()`` (and ``restoreDockWidget()`` for
+the lazily built docks) identify docks purely by ``objectName``; an unnamed or
+duplicated name silently drops that dock from the saved layout. Pure AST scans
+of ``gui/`` -- no PySide6 import.
+"""
+import ast
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DOCKS_DIR = os.path.join(REPO_ROOT, "gui", "docks")
+MAIN_WINDOW_PATH = os.path.join(REPO_ROOT, "gui", "main_window.py")
+
+
+def _parse(path):
+    with open(path, encoding="utf-8") as f:
+        return ast.parse(f.read(), filename=path)
+
+
+def _dock_object_names():
+    """Map each BaseDockWidget subclass to the literal objectName its __init__ sets."""
+    names = {}
+    for filename in sorted(os.listdir(DOCKS_DIR)):
+        if not filename.endswith(".py") or filename == "base_dock.py":
+            continue
+        for node in _parse(os.path.join(DOCKS_DIR, filename)).body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            if not any(getattr(base, "id", None) == "BaseDockWidget" for base in node.bases):
+                continue
+            init = next(
+                (item for item in node.body
+                 if isinstance(item, ast.FunctionDef) and item.name == "__init__"),
+                None,
+            )
+            calls = [] if init is None else [
+                call for call in ast.walk(init)
+                if isinstance(call, ast.Call)
+                and isinstance(call.func, ast.Attribute)
+                and call.func.attr == "setObjectName"
+                and isinstance(call.func.value, ast.Name) and call.func.value.id == "self"
+            ]
+            literal = calls and isinstance(calls[0].args[0], ast.Constant)
+            names[node.name] = calls[0].args[0].value if literal else None
+    return names
+
+
+def test_every_dock_sets_a_literal_object_name():
+    names = _dock_object_names()
+    assert names, "no dock classes found"
+    unnamed = sorted(cls for cls, name in names.items() if not name)
+    assert not unnamed, f"docks without setObjectName(<literal>): {unnamed}"
+
+
+def test_dock_object_names_are_unique():
+    names = [name for name in _dock_object_names().values() if name]
+    assert len(names) == len(set(names))
+
+
+def test_lazy_dock_factory_keys_match_dock_object_names():
+    """``_dock_factories`` is keyed by objectName; a typo would never reopen the dock."""
+    tree = _parse(MAIN_WINDOW_PATH)
+    factories = next(
+        node.value for node in ast.walk(tree)
+        if isinstance(node, ast.Assign)
+        and any(isinstance(t, ast.Attribute) and t.attr == "_dock_factories" for t in node.targets)
+    )
+    keys = {key.value for key in factories.keys}
+    assert keys
+    assert keys <= set(_dock_object_names().values())
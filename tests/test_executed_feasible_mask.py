@@ -64,3 +64,56 @@ def test_both_engines_mark_only_after_storing_counts():
     for position in positions:
         preceding_storage_block = source[max(0, position - 900):position]
         assert "res.counts" in preceding_storage_block
+
+
+class _BatchFailsState:
+    """Batch solve raises; the scalar solve rejects only the Q=(9, 0, 0) point."""
+    fixed_E, K_fixed, monocris, anacris = 14.7, "Kf Fixed", "pg002", "pg002"
+
+    def calculate_angles_batch(self, *args):
+        raise FloatingPointError("batch solve failed")
+
+    def calculate_angles(self, qx, qy, qz, deltaE, *args):
+        if qx == 9.0:
+            raise ValueError("bad point")
+        return [0.0] * 5, ["Q unreachable"] if qx > 5.0 else []
+
+
+def test_valid_mask_falls_back_to_per_point_solve_when_batch_raises():
+    valid_mask = controller_module.TAVIController._scan_valid_mask
+    q_points = [(1.0, 0.0, 0.0, 0.0), None, (6.0, 0.0, 0.0, 0.0),
+                (9.0, 0.0, 0.0, 0.0), (2.0, 0.0, 0.0, 1.0)]
+
+    assert valid_mask(_BatchFailsState(), "momentum", q_points) == [
+        True, False, False, False, True,
+    ]
+
+
+class _ScaledMount:
+    def hkl_to_q(self, H, K, L):
+        return (2.0 * float(H), 2.0 * float(K), 2.0 * float(L))
+
+
+def test_run_and_count_points_share_one_q_parser():
+    point_q = controller_module.TAVIController._scan_point_q
+    hkl_index = controller_module.TAVIController._COUNT_VARIABLE_TO_INDEX["h"]
+    run_point = [1.0, 0.5, 0.0, 3.0]
+    count_point = [0.0, 0.0, 0.0, 3.0] + [0.0] * 7 + [1.0, 0.5, 0.0]
+
+    run_q = point_q(run_point, "rlu", _ScaledMount())
+    assert run_q == point_q(count_point, "rlu", _ScaledMount(), hkl_index=hkl_index)
+    assert run_q[3] == 3.0
+    assert point_q(run_point, "momentum", _ScaledMount()) == tuple(run_point)
+    assert point_q(run_point, "angle", _ScaledMount()) is None
+    assert point_q([None, 0.5, 0.0, 3.0], "rlu", _ScaledMount()) is None
+
+
+def test_valid_mask_does_not_hide_unexpected_batch_errors():
+    class _BrokenBatchState(_BatchFailsState):
+        def calculate_angles_batch(self, *args):
+            raise TypeError("solver bug")
+
+    with pytest.raises(TypeError):
+        controller_module.TAVIController._scan_valid_mask(
+            _BrokenBatchState(), "momentum", [(1.0, 0.0, 0.0, 0.0)]
+        )
@@ -0,0 +1,135 @@
+"""Main-window layout persistence against a real window (offscreen Qt).
+
+The saved layout is read on the thread pool and applied on a later event-loop
+pass, so the window briefly shows the default arrangement. These tests pin
+that closing the window in that gap never overwrites the user's saved layout.
+The layout file is redirected to a temporary directory.
+"""
+import json
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QThreadPool  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+import gui.main_window as main_window  # noqa: E402
+import instruments.builtin  # noqa: F401,E402  (registers built-in instruments)
+from instruments.registry import get_instrument  # noqa: E402
+
+
+@pytest.fixture
+def make_window(tmp_path, monkeypatch):
+    """Build main windows whose layout file lives in ``tmp_path``."""
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    layout_path = tmp_path / "view_layout.json"
+    monkeypatch.setattr(main_window, "_LAYOUT_CONFIG_PATH", str(layout_path))
+    descriptor = get_instrument("puma").descriptor()
+    windows = []
+
+    def make():
+        window = main_window.TAVIMainWindow(descriptor)
+        windows.append(window)
+        return window
+
+    make.layout_path = layout_path
+    make.app = app
+    yield make
+    QThreadPool.globalInstance().waitForDone()
+    for window in windows:
+        window._layout_writer_pool.waitForDone()
+        window.deleteLater()
+    app.processEvents()
+
+
+def _save_layout_with_misalignment_open(make_window):
+    window = make_window()
+    window.ensure_misalignment_dock().setVisible(True)
+    window.save_layout_to_file()
+    window._layout_writer_pool.waitForDone()
+    window.close()
+    return make_window.layout_path.read_text(encoding="utf-8")
+
+
+def test_close_before_restore_lands_keeps_saved_layout(make_window):
+    saved = _save_layout_with_misalignment_open(make_window)
+
+    window = make_window()
+    # The read finishes, but its result has not been delivered to the window.
+    QThreadPool.globalInstance().waitForDone()
+    assert window._layout_restore_pending
+    window.close()
+    window._layout_writer_pool.waitForDone()
+
+    assert make_window.layout_path.read_text(encoding="utf-8") == saved
+
+
+def test_restored_layout_reopens_lazy_docks(make_window):
+    _save_layout_with_misalignment_open(make_window)
+
+    window = make_window()
+    QThreadPool.globalInstance().waitForDone()
+    for _ in range(3):
+        make_window.app.processEvents()
+
+    assert not window._layout_restore_pending
+    assert window.misalignment_dock is not None
+    assert window.misalignment_dock.isVisible()
+
+
+def test_close_saves_only_a_changed_layout(make_window, monkeypatch):
+    _save_layout_with_misalignment_open(make_window)
+    window = make_window()
+    window.show()
+    QThreadPool.globalInstance().waitForDone()
+    for _ in range(3):
+        make_window.app.processEvents()
+    saves = []
+    monkeypatch.setattr(window, "save_layout_to_file", lambda: saves.append(True))
+
+    assert not window._layout_needs_save()
+    window.close()
+    assert saves == []
+
+    window.show()
+    window.misalignment_dock.setVisible(False)
+    assert window._layout_needs_save()
+    window.close()
+    assert saves == [True]
+
+
+@pytest.mark.parametrize("layout_data, expected", [
+    ({"layout_version": 2,
+      "dock_visibility": {"MisalignmentDock": True, "ReciprocalSpaceDock": False}},
+     ["MisalignmentDock"]),
+    ({"layout_version": 3, "open_lazy_docks": ["ReciprocalSpaceDock"],
+      "dock_visibility": {"MisalignmentDock": True}},
+     ["ReciprocalSpaceDock"]),
+])
+def test_read_layout_file_by_version(tmp_path, layout_data, expected):
+    path = tmp_path / "view_layout.json"
+    path.write_text(json.dumps(layout_data), encoding="utf-8")
+    assert main_window._read_layout_file(str(path))["open_lazy_docks"] == expected
+
+
+def test_saved_layout_is_current_version(make_window):
+    _save_layout_with_misalignment_open(make_window)
+    layout_data = json.loads(make_window.layout_path.read_text(encoding="utf-8"))
+    assert layout_data["layout_version"] == main_window.TAVIMainWindow.LAYOUT_VERSION == 3
+    assert "dock_visibility" not in layout_data
+
+
+def test_lazy_docks_keep_their_view_menu_slot(make_window):
+    window = make_window()
+    panels = [a.text() for a in window._view_menu.actions()][1:12]
+    assert panels[3] == "Misalignment Training"
+    assert panels[7] == "Reciprocal Space"
+
+    window.ensure_misalignment_dock()
+    assert [a.text() for a in window._view_menu.actions()][1:12] == panels
+    assert window._view_menu.actions()[4] is window.misalignment_dock.toggleViewAction()
@@ -203,6 +203,52 @@ def test_crystal_adapter_matches_golden_dicts():
     assert mono_ana_crystals_setup("nope", "nope") == ({}, {})
 
 
+def test_crystal_adapter_is_memoized_and_returns_copies():
+    pytest.importorskip("mcstasscript")
+    from instruments.puma.model import _descriptor_crystal_info, mono_ana_crystals_setup
+
+    mono_ana_crystals_setup("pg002", "pg002")
+    hits = _descriptor_crystal_info.cache_info().hits
+    mono, ana = mono_ana_crystals_setup("pg002", "pg002")
+    assert _descriptor_crystal_info.cache_info().hits == hits + 1
+
+    mono['dm'] = 1.0
+    ana['da'] = 1.0
+    assert mono_ana_crystals_setup("pg002", "pg002") == (_GOLDEN_PG002_MONO, _GOLDEN_PG002_ANA)
+
+
+def test_state_with_cached_crystals_pickles():
+    pytest.importorskip("mcstasscript")
+    import pickle
+
+    from instruments.puma.model import PUMA_Instrument
+
+    state = PUMA_Instrument()
+    state.cached_crystal_info("pg002", "pg002")
+    restored = pickle.loads(pickle.dumps(state))
+    assert restored.cached_crystal_info("pg002", "pg002") == (
+        _GOLDEN_PG002_MONO, _GOLDEN_PG002_ANA
+    )
+
+
+def test_state_crystal_cache_is_copied_by_deep_copies():
+    pytest.importorskip("mcstasscript")
+    import copy
+
+    from instruments.puma.model import PUMA_Instrument
+
+    state = PUMA_Instrument()
+    mono, ana = state.cached_crystal_info("pg002", "pg002")
+    assert mono['dm'] == 3.355
+    point_state = copy.deepcopy(state)
+    point_mono, _ = point_state.cached_crystal_info("pg002", "pg002")
+    assert point_mono == mono
+    assert point_mono is not mono
+
+    mono_test, _ = state.cached_crystal_info("pg002_test", "pg002")
+    assert mono_test['dm'] == 2.355
+
+
 def test_crystal_info_matches_adapter():
     pytest.importorskip("mcstasscript")
     from instruments.puma.model import mono_ana_crystals_setup
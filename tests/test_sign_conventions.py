@@ -234,6 +234,89 @@ def test_negative_analyzer_sense_inelastic_round_trip(fixed_mode, delta_e):
     assert q_and_e[3] == pytest.approx(delta_e, abs=1e-6)
 
 
+@pytest.mark.parametrize("fixed_mode", ["Ki Fixed", "Kf Fixed"])
+def test_fixed_arm_cache_follows_fixed_energy_changes(fixed_mode):
+    """The fixed-arm k/two-theta is cached per (fixed_E, mode, crystals);
+    a reused state must match a fresh one after fixed_E changes."""
+    from instruments.puma.model import PUMA_Instrument
+
+    reused = PUMA_Instrument()
+    for fixed_e in (14.7, 8.0, 14.7):
+        angles, error_flags = reused.calculate_angles(
+            2 * TAU, 0.0, 0.0, 1.0, fixed_e, fixed_mode, "pg002", "pg002"
+        )
+        fresh, fresh_flags = PUMA_Instrument().calculate_angles(
+            2 * TAU, 0.0, 0.0, 1.0, fixed_e, fixed_mode, "pg002", "pg002"
+        )
+        assert error_flags == fresh_flags
+        assert angles == fresh
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_negative_final_energy_is_flagged(tas):
+    """Ef < 0 gives kf = NaN; the Bragg and two-theta guards must reject it
+    rather than pass NaN angles through as a valid point."""
+    angles, error_flags = tas.calculate_angles(
+        2 * TAU, 0.0, 0.0, 20.0, 14.7, "Ki Fixed", "pg002", "pg002"
+    )
+    assert "att" in error_flags
+    assert "stt" in error_flags
+
+
+# energy2k takes sqrt of the negative final energy (NaN, with a warning).
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("senses", [(1, -1, 1), (1, 1, -1)])
+@pytest.mark.parametrize("fixed_mode", ["Ki Fixed", "Kf Fixed"])
+def test_batch_angles_match_scalar_calculate_angles(senses, fixed_mode):
+    from instruments.puma.model import PUMA_Instrument
+
+    state = PUMA_Instrument()
+    state.sense_mono, state.sense_sample, state.sense_ana = senses
+    points = [
+        (2 * TAU, 0.0, 0.0, 0.0),
+        (TAU, TAU, 0.0, 3.0),
+        (1.55, 0.0, 0.3, -2.0),
+        (0.0, 0.0, 0.0, 0.0),      # zero Q
+        (10 * TAU, 0.0, 0.0, 0.0),  # |Q| unreachable
+        (2 * TAU, 0.0, 0.0, 40.0),  # negative Ef or huge Ei
+    ]
+    qx, qy, qz, delta_e = np.array(points).T
+
+    angles, valid = state.calculate_angles_batch(
+        qx, qy, qz, delta_e, 14.7, fixed_mode, "pg002", "pg002"
+    )
+
+    for i, point in enumerate(points):
+        scalar, error_flags = state.calculate_angles(
+            *point, 14.7, fixed_mode, "pg002", "pg002"
+        )
+        scalar_valid = not error_flags and all(math.isfinite(a) for a in scalar)
+        assert bool(valid[i]) == scalar_valid
+        if scalar_valid:
+            assert angles[:, i] == pytest.approx(scalar, abs=1e-9)
+
+
+def test_batch_angles_unknown_crystal_is_all_invalid(tas):
+    angles, valid = tas.calculate_angles_batch(
+        [2 * TAU, TAU], 0.0, 0.0, 0.0, 14.7, "Ki Fixed", "nope", "pg002"
+    )
+    assert angles.shape == (5, 2)
+    assert not valid.any()
+
+
+def test_angle_solver_is_quiet_unless_verbose(capsys):
+    from instruments.puma.model import PUMA_Instrument
+
+    state = PUMA_Instrument()
+    state.calculate_angles(2 * TAU, 0.0, 0.0, 0.0, 14.7, "Ki Fixed", "pg002", "pg002")
+    state.calculate_angles(10 * TAU, 0.0, 0.0, 0.0, 14.7, "Ki Fixed", "pg002", "pg002")
+    assert capsys.readouterr().out == ""
+
+    state.verbose = True
+    state.calculate_angles(2 * TAU, 0.0, 0.0, 0.0, 14.7, "Ki Fixed", "pg002", "pg002")
+    assert "mtt:" in capsys.readouterr().out
+
+
 def test_default_instrument_senses_are_baked_convention():
     from instruments.puma.model import PUMA_Instrument
     from instruments.tas_runtime import TAS_Instrument
@@ -12,6 +12,7 @@ from tavi.tas_geometry import (
     q_instrument_from_angles,
     solve_sample_angles,
     solve_instrument_angles,
+    solve_instrument_angles_batch,
     q_sample_from_angles,
 )
 from tavi.ub_matrix import ObservedPeak, UBMatrix, calculate_U_two_peaks, compute_B_matrix
@@ -96,6 +97,42 @@ def test_instrument_angle_roundtrip_preserves_legacy_q_convention():
         assert_vec_close(roundtrip, q)
 
 
+def test_batch_instrument_angles_match_scalar_solver():
+    ki = energy2k(30.0)
+    kf = energy2k(25.0)
+    targets = np.array([
+        [1.2, 0.7, 0.0],
+        [-1.1, 0.4, 0.0],
+        [0.9, 0.6, 0.25],
+        [0.9, -0.6, -0.25],
+    ])
+
+    for sense_sample in (-1, 1):
+        stt, sth, saz, valid = solve_instrument_angles_batch(
+            targets, ki, kf, sense_sample=sense_sample
+        )
+        assert valid.all()
+        for i, q in enumerate(targets):
+            angles = solve_instrument_angles(q, ki, kf, sense_sample=sense_sample)
+            assert_vec_close((stt[i], sth[i], saz[i]), (angles.stt, angles.sth, angles.saz))
+
+
+def test_batch_instrument_angles_flag_unreachable_points():
+    ki = kf = energy2k(14.7)
+    targets = np.array([
+        [2.0, 0.0, 0.0],   # reachable
+        [0.0, 0.0, 0.0],   # zero Q
+        [20.0, 0.0, 0.0],  # scattering triangle does not close
+    ])
+
+    stt, sth, saz, valid = solve_instrument_angles_batch(targets, ki, [kf, kf, np.nan])
+
+    assert valid.tolist() == [True, False, False]
+    assert stt[1:].tolist() == [0.0, 0.0]
+    assert sth[1:].tolist() == [0.0, 0.0]
+    assert saz[1:].tolist() == [0.0, 0.0]
+
+
 def test_default_tas_mount_maps_hk0_to_horizontal_plane():
     mount = SampleMount.from_lattice_tas(4.0, 4.0, 4.0, 90, 90, 90)
 
@@ -134,6 +171,15 @@ def test_mount_rotation_roundtrips_to_mccode_euler_angles():
     assert_vec_close(mccode_rotation_matrix(rx, ry, rz), rotation)
 
 
+def test_mccode_euler_from_matrix_propagates_nan():
+    rotation = mccode_rotation_matrix(-30, 10, 20)
+    rotation[2, 0] = np.nan
+
+    _, ry, _ = mccode_euler_from_matrix(rotation)
+
+    assert math.isnan(ry)
+
+
 def test_ub_from_observed_peaks_recovers_mount_matrix():
     ki = kf = energy2k(30.0)
     B = compute_B_matrix(4.0, 4.0, 4.0, 90, 90, 90)